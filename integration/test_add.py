@@ -40,6 +40,38 @@ async def test_add(request, reactor, alice):
     )
 
 
+@inline_callbacks
+@pytest_twisted.ensureDeferred
+async def test_add_participants(request, reactor, alice):
+    """
+    A newly added magic-folder lists its own author as the only
+    participant, and its Collective and Personal DMDs hold the
+    expected entries.
+    """
+    caps = await alice.add(
+        request,
+        "participants",
+        alice.magic_directory,
+        author="laptop",
+    )
+
+    participants = await alice.client.list_participants("participants")
+    assert participants == {
+        "laptop": {
+            "personal_dmd": caps["readonly_cap"],
+        },
+    }
+
+    tahoe = alice.tahoe_client()
+    mf_config = alice.global_config().get_magic_folder("participants")
+    collective = await tahoe.list_directory(mf_config.collective_dircap)
+    assert set(collective) == {"@metadata", "laptop"}
+    assert collective["laptop"][0].danger_real_capability_string() == caps["readonly_cap"]
+
+    personal = await tahoe.list_directory(mf_config.upload_dircap)
+    assert set(personal) == {"@metadata"}
+
+
 @inline_callbacks
 @pytest_twisted.ensureDeferred
 async def test_leave(request, reactor, temp_filepath, alice, bob):
@@ -9,9 +9,14 @@ import pytest_twisted
 
 from .util import (
     await_file_contents,
+    leave_on_cleanup,
 )
 
 
+_CONTENT_FROM_BOB = b"from bobby\n" * 1000
+_CONTENT_FROM_ALICE = b"from alice\n" * 1000
+
+
 @inline_callbacks
 @pytest_twisted.ensureDeferred
 async def test_invite_join(request, reactor, temp_filepath, alice, bob, wormhole):
@@ -33,9 +38,7 @@ async def test_invite_join(request, reactor, temp_filepath, alice, bob, wormhole
     magic_b.makedirs()
     await bob.join(code, "invited", magic_b.path, "bob", poll_interval=1, scan_interval=1)
 
-    def cleanup_bob():
-        pytest_twisted.blockon(bob.leave("invited"))
-    request.addfinalizer(cleanup_bob)
+    leave_on_cleanup(request, bob, "invited")
 
     await magic_proto.exited
     print("bob invited to alice's folder")
@@ -43,21 +46,19 @@ async def test_invite_join(request, reactor, temp_filepath, alice, bob, wormhole
     # confirm that the folders are paired:
 
     # second, add something to bob and it should appear in alice
-    content1 = b"from bobby\n" * 1000
-    magic_b.child("file_from_bob").setContent(content1)
+    magic_b.child("file_from_bob").setContent(_CONTENT_FROM_BOB)
 
     await await_file_contents(
         magic_a.child("file_from_bob").path,
-        content1,
+        _CONTENT_FROM_BOB,
     )
 
     # first, add something to alice and it should appear in bob
-    content0 = b"from alice\n" * 1000
-    magic_a.child("file_from_alice").setContent(content0)
+    magic_a.child("file_from_alice").setContent(_CONTENT_FROM_ALICE)
 
     await await_file_contents(
         magic_b.child("file_from_alice").path,
-        content0,
+        _CONTENT_FROM_ALICE,
     )
 
 
@@ -2,7 +2,6 @@
 Testing synchronizing files between participants
 """
 
-import json
 import random
 
 import pytest_twisted
@@ -17,9 +16,25 @@ from magic_folder.util.capabilities import (
     Capability,
 )
 from .util import (
-    twisted_sleep,
+    uploads_finished,
 )
 
+_CAT_NAMES = (
+    'Garfield.jpeg',
+    'Cheshire.jpeg',
+    'Grumpy.jpeg',
+    'lolcat.jpeg',
+    'Waffles.jpeg',
+)
+
+# every cat is created at the top-level and again in "subdir/"
+_EXPECTED_CAT_RELPATHS = frozenset(
+    _CAT_NAMES + tuple("subdir/{}".format(n) for n in _CAT_NAMES)
+)
+
+# keys in a Personal DMD listing which aren't magic-paths
+_METADATA_KEYS = frozenset({"@metadata"})
+
 
 @inline_callbacks
 @pytest_twisted.ensureDeferred
@@ -36,26 +51,16 @@ async def test_kittens(request, reactor, temp_filepath, alice):
     assert len(KILO_OF_DATA) >= 2**10, "isn't actually a kibibyte"
 
     def create_random_cat_pic(path, kilobytes):
-        with path.open("w") as f:
-            for _ in range(kilobytes):
-                f.write(KILO_OF_DATA)
+        path.setContent(KILO_OF_DATA * kilobytes)
 
     print("creating test data")
-    cat_names = [
-        'Garfield.jpeg',
-        'Cheshire.jpeg',
-        'Grumpy.jpeg',
-        'lolcat.jpeg',
-        'Waffles.jpeg',
-    ]
-
-    for top_level in cat_names:
+    for top_level in _CAT_NAMES:
         size = random.randrange(200, 356)
         create_random_cat_pic(magic.child(top_level), size)
         print("  {} {}KiB".format(top_level, size))
 
     magic.child("subdir").makedirs()
-    for sub_level in cat_names:
+    for sub_level in _CAT_NAMES:
         size = random.randrange(60, 200)
         create_random_cat_pic(magic.child("subdir").child(sub_level), size)
         print("  subdir/{} {}KiB".format(sub_level, size))
@@ -65,9 +70,13 @@ async def test_kittens(request, reactor, temp_filepath, alice):
 
     # perform a scan, which will create LocalSnapshots for all the
     # files we already created in the magic-folder (but _not_ upload
-    # them, necessarily, yet)
+    # them, necessarily, yet). We know exactly which files we wrote,
+    # so only those are scanned rather than walking the whole folder.
+    status = await alice.status_stream()
+    request.addfinalizer(status.close)
+
     print("start scan")
-    await alice.scan("kitties")
+    await alice.scan("kitties", paths=sorted(_EXPECTED_CAT_RELPATHS))
     print("scan done")
 
     def find_uploads(data):
@@ -78,15 +87,12 @@ async def test_kittens(request, reactor, temp_filepath, alice):
         return pending
 
     # wait for a limited time to be complete
-    uploads = 0
-    for _ in range(10):
-        st = await alice.status()
-        data = json.loads(st.strip())
-        uploads = len(find_uploads(data))
-        if uploads == 0:
-            break
-        await twisted_sleep(reactor, 1)
-    assert uploads == 0, "Should be finished uploading"
+    await status.wait_for(
+        lambda events: uploads_finished(events, "kitties") >= _EXPECTED_CAT_RELPATHS,
+        timeout=10,
+    )
+    data = await alice.status()
+    assert len(find_uploads(data)) == 0, "Should be finished uploading"
 
     errors = [
         evt for evt in data["events"]
@@ -95,9 +101,8 @@ async def test_kittens(request, reactor, temp_filepath, alice):
     assert errors == [], "Expected zero errors: {}".format(errors)
 
     recent = await alice.client.recent_changes("kitties")
-    actual_cats = {cat["relpath"] for cat in recent}
-    expected = set(cat_names + ["subdir/{}".format(n) for n in cat_names])
-    assert expected == actual_cats, "Data mismatch"
+    actual_cats = frozenset(cat["relpath"] for cat in recent)
+    assert _EXPECTED_CAT_RELPATHS == actual_cats, "Data mismatch"
 
     # confirm that we can navigate Collective -> alice and find the
     # correct Snapshots (i.e. one for every cat-pic)
@@ -106,9 +111,9 @@ async def test_kittens(request, reactor, temp_filepath, alice):
     files = await alice.tahoe_client().list_directory(
         Capability.from_string(folders["kitties"]["upload_dircap"])
     )
-    names = {
+    names = frozenset(
         magic2path(k)
-        for k in files.keys()
-        if k not in {"@metadata"}
-    }
-    assert expected == names, "Data mismatch"
+        for k in files
+        if k not in _METADATA_KEYS
+    )
+    assert _EXPECTED_CAT_RELPATHS == names, "Data mismatch"
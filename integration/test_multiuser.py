@@ -10,6 +10,8 @@ import pytest_twisted
 from .util import (
     await_file_contents,
     find_conflicts,
+    leave_on_cleanup,
+    restart_on_cleanup,
 )
 from twisted.internet.defer import DeferredList
 
@@ -41,9 +43,7 @@ async def perform_invite(request, folder_name, inviter, invitee_name, invitee, i
         read_only=read_only,
     )
 
-    def cleanup_invitee():
-        pytest_twisted.blockon(invitee.leave(folder_name))
-    request.addfinalizer(cleanup_invitee)
+    leave_on_cleanup(request, invitee, folder_name)
 
     await magic_proto.exited
     print(f"{invitee_name} successfully invited to {folder_name}")
@@ -140,9 +140,7 @@ async def test_participant_never_updates(request, reactor, temp_filepath, alice,
     # turn off bob (but arrange to re-start)
     await bob.stop_magic_folder()
 
-    def cleanup():
-        pytest_twisted.blockon(bob.start_magic_folder())
-    request.addfinalizer(cleanup)
+    restart_on_cleanup(request, bob)
 
     # do some updates
     magic.child("content.txt").setContent(content1)
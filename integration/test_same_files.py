@@ -2,8 +2,6 @@
 Testing synchronizing files between participants
 """
 
-import json
-
 import pytest_twisted
 from eliot.twisted import (
     inline_callbacks,
@@ -16,9 +14,11 @@ from magic_folder.util.capabilities import (
     Capability,
 )
 from .util import (
-    twisted_sleep,
+    uploads_finished,
 )
 
+_METADATA_KEYS = frozenset({"@metadata"})
+
 
 @inline_callbacks
 @pytest_twisted.ensureDeferred
@@ -56,6 +56,9 @@ async def test_identical_files(request, reactor, temp_filepath, alice, bob):
     # perform a scan, which will create LocalSnapshots for all the
     # files we already created in the magic-folder (but _not_ upload
     # them, necessarily, yet)
+    status = await alice.status_stream()
+    request.addfinalizer(status.close)
+
     print("start scan")
     await alice.scan("sames")
     print("scan done")
@@ -68,14 +71,12 @@ async def test_identical_files(request, reactor, temp_filepath, alice, bob):
         return pending
 
     # wait for a limited time to be complete
-    uploads = 0
-    for _ in range(10):
-        data = json.loads(await alice.status())
-        uploads = len(find_uploads(data))
-        if uploads == 0:
-            break
-        await twisted_sleep(reactor, 1)
-    assert uploads == 0, "Should be finished uploading"
+    await status.wait_for(
+        lambda events: uploads_finished(events, "sames") >= set(cat_names),
+        timeout=10,
+    )
+    data = await alice.status()
+    assert len(find_uploads(data)) == 0, "Should be finished uploading"
 
     errors = [
         evt for evt in data["events"]
@@ -97,7 +98,7 @@ async def test_identical_files(request, reactor, temp_filepath, alice, bob):
     )
     names = {
         magic2path(k)
-        for k in files.keys()
-        if k not in {"@metadata"}
+        for k in files
+        if k not in _METADATA_KEYS
     }
     assert expected == names, "Data mismatch"
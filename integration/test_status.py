@@ -1,4 +1,3 @@
-import json
 import pytest_twisted
 from eliot.twisted import (
     inline_callbacks,
@@ -50,8 +49,7 @@ async def test_multiple_outstanding_downloads(request, reactor, alice, temp_file
     start = reactor.seconds()
     noticed = set()
     while (reactor.seconds() - start < 10) and len(noticed) != len(filenames):
-        status_data = await alice.status()
-        status = json.loads(status_data)
+        status = await alice.status()
         downloads = [
             down
             for down in status["events"]
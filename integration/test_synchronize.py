@@ -3,8 +3,10 @@ Testing synchronizing files between participants
 """
 
 import sys
+import time
 from functools import partial
 
+import attr
 from eliot import (
     log_message,
 )
@@ -14,14 +16,14 @@ from eliot.twisted import (
 import pytest
 import pytest_twisted
 
-from magic_folder.util.capabilities import (
-    Capability,
-)
 from .util import (
     await_file_contents,
     await_file_vanishes,
+    await_upload_complete,
     ensure_file_not_created,
-    twisted_sleep,
+    poll_until,
+    restart_on_cleanup,
+    uploads_finished,
     database_retry,
 )
 
@@ -39,6 +41,13 @@ def non_lit_content(s):
     return "{} {}\n".format(s, "." * max(55 - len(s), 0)).encode("utf8")
 
 
+# successive versions of the files used by the tests below
+_CONTENT_ZERO = non_lit_content("zero")
+_CONTENT_ONE = non_lit_content("one")
+_CONTENT_TWO = non_lit_content("two")
+_CONTENT_THREE = non_lit_content("three")
+
+
 def add_snapshot(node, folder_name, path):
     """
     Take a snapshot of the given path in the given magic folder.
@@ -58,6 +67,7 @@ def scan_folder(node, folder_name, path):
     return node.scan_folder(folder_name)
 
 
+@inline_callbacks
 def periodic_scan(node, folder_name, path):
     """
     Wait for the given magic folder to run a periodic scan.  This
@@ -65,10 +75,33 @@ def periodic_scan(node, folder_name, path):
 
     :param MagicFolderEnabledNode node: The node on which to do the scan.
     """
-    from twisted.internet import reactor
     log_message(message_type="integration:wait_for_scan", node=node.name, folder=folder_name)
-    # XXX need a better way than "wait 3 seconds" to know if the scan is completed...
-    return twisted_sleep(reactor, 3.0)
+    started = time.time()
+
+    def scans_since_start(events):
+        return {
+            event["timestamp"]
+            for event in events
+            if event["kind"] == "scan-completed"
+            and event["folder"] == folder_name
+            and (event["timestamp"] or 0) > started
+        }
+
+    # a scan which completes after we start waiting may have started
+    # before the file was changed, so wait for the one after that too
+    # (which must have started after we began waiting) unless we see
+    # the upload itself first.
+    status = yield node.status_stream()
+    try:
+        yield status.wait_for(
+            lambda events: (
+                path in uploads_finished(events, folder_name)
+                or len(scans_since_start(events)) >= 2
+            ),
+            timeout=20,
+        )
+    finally:
+        status.close()
 
 
 @pytest.fixture(
@@ -98,6 +131,33 @@ def take_snapshot(request, magic_folder_nodes, monkeypatch):
     return request.param
 
 
+@attr.s(frozen=True)
+class RecoveryDirectories(object):
+    """
+    The local directories of an 'original' magic-folder and of the
+    folder that will recover it.
+    """
+    original = attr.ib()
+    recover = attr.ib()
+
+
+@pytest.fixture
+def recovery_dirs(temp_filepath):
+    """
+    Pytest fixture that creates the (empty) 'original' and 'recovery'
+    folder directories most of the tests below need.
+
+    :returns RecoveryDirectories: the two directories, as ``FilePath``
+    """
+    dirs = RecoveryDirectories(
+        original=temp_filepath.child("cats"),
+        recover=temp_filepath.child("kitties"),
+    )
+    dirs.original.makedirs()
+    dirs.recover.makedirs()
+    return dirs
+
+
 @inline_callbacks
 @pytest_twisted.ensureDeferred
 @pytest.mark.skipif(sys.platform.startswith("win"), reason="suspend() doesn't work on windows")
@@ -113,8 +173,7 @@ async def test_local_snapshots(request, reactor, temp_filepath, alice, bob, take
     local_cfg = alice.global_config().get_magic_folder("local")
 
     # put a file in our folder
-    content0 = non_lit_content("zero")
-    magic.child("sylvester").setContent(content0)
+    magic.child("sylvester").setContent(_CONTENT_ZERO)
     await take_snapshot(alice, "local", "sylvester")
 
     # wait until we've definitely uploaded it
@@ -128,16 +187,12 @@ async def test_local_snapshots(request, reactor, temp_filepath, alice, bob, take
     alice.pause_tahoe()
 
     try:
-        # add several snapshots
-        content1 = non_lit_content("one")
-        magic.child("sylvester").setContent(content1)
-        await take_snapshot(alice, "local", "sylvester")
-        content2 = non_lit_content("two")
-        magic.child("sylvester").setContent(content2)
-        await take_snapshot(alice, "local", "sylvester")
-        content3 = non_lit_content("three")
-        magic.child("sylvester").setContent(content3)
-        await take_snapshot(alice, "local", "sylvester")
+        # add several snapshots; these can't be taken concurrently
+        # since each one must see its own content and have the
+        # previous one as its parent
+        for content in (_CONTENT_ONE, _CONTENT_TWO, _CONTENT_THREE):
+            magic.child("sylvester").setContent(content)
+            await take_snapshot(alice, "local", "sylvester")
 
         x = await alice.dump_state("local")
         print(x)
@@ -161,20 +216,19 @@ async def test_local_snapshots(request, reactor, temp_filepath, alice, bob, take
 
     # local snapshots should turn into remotes...and thus change our
     # remote snapshot pointer
-    found = False
-    for _ in range(10):
-        if len(local_cfg.get_all_localsnapshot_paths()) == 0:
-            if local_cfg.get_remotesnapshot("sylvester") != former_remote:
-                found = True
-                break
-        await twisted_sleep(reactor, 1)
+    def only_new_remote():
+        if len(local_cfg.get_all_localsnapshot_paths()) != 0:
+            return False
+        return local_cfg.get_remotesnapshot("sylvester") != former_remote
+
+    found = await poll_until(reactor, only_new_remote, bool, timeout=10)
     assert found, "Expected 'sylvester' to be (only) a remote-snapshot"
 
 
 @inline_callbacks
 @pytest_twisted.ensureDeferred
 @pytest.mark.parametrize("relpath", ["dinah", "nested/felicia"])
-async def test_create_then_recover(request, reactor, temp_filepath, alice, bob, take_snapshot, relpath):
+async def test_create_then_recover(request, reactor, recovery_dirs, alice, bob, take_snapshot, relpath):
     """
     Test a version of the expected 'recover' workflow:
     - make a magic-folder on device 'alice'
@@ -196,26 +250,23 @@ async def test_create_then_recover(request, reactor, temp_filepath, alice, bob,
 
     # "alice" contains the 'original' magic-folder
     # "bob" contains the 'recovery' magic-folder
-    original_folder = temp_filepath.child("cats")
-    recover_folder = temp_filepath.child("kitties")
+    original_folder = recovery_dirs.original
+    recover_folder = recovery_dirs.recover
 
     original_file = original_folder.preauthChild(relpath)
-    original_file.parent().makedirs()
+    original_file.parent().makedirs(ignoreExistingDirectory=True)
     recover_file = recover_folder.preauthChild(relpath)
-    recover_file.parent().makedirs()
+    recover_file.parent().makedirs(ignoreExistingDirectory=True)
 
     # add our magic-folder and re-start
-    await alice.add(request, "original", original_folder.path)
-    alice_folders = await alice.list_(True)
+    alice_folder = await alice.add(request, "original", original_folder.path)
 
     # put a file in our folder
-    content0 = non_lit_content("zero")
-    original_file.setContent(content0)
+    original_file.setContent(_CONTENT_ZERO)
     await take_snapshot(alice, "original", relpath)
 
     # update the file (so now there's two versions)
-    content1 = non_lit_content("one")
-    original_file.setContent(content1)
+    original_file.setContent(_CONTENT_ONE)
     await take_snapshot(alice, "original", relpath)
 
     # create the 'recovery' magic-folder
@@ -223,46 +274,41 @@ async def test_create_then_recover(request, reactor, temp_filepath, alice, bob,
 
     # add the 'original' magic-folder as a participant in the
     # 'recovery' folder
-    alice_cap = Capability.from_string(alice_folders["original"]["upload_dircap"]).to_readonly().danger_real_capability_string()
+    alice_cap = alice_folder["readonly_cap"]
     await bob.add_participant("recovery", "alice", alice_cap)
 
     # we should now see the only Snapshot we have in the folder appear
     # in the 'recovery' filesystem
     await await_file_contents(
         recover_file.path,
-        content1,
+        _CONTENT_ONE,
         timeout=25,
     )
 
     # in the (ideally rare) case that the old device is found *and* a
     # new snapshot is uploaded, we put an update into the 'original'
     # folder. This also tests the normal 'update' flow as well.
-    content2 = non_lit_content("two")
-    original_file.setContent(content2)
+    original_file.setContent(_CONTENT_TWO)
     await take_snapshot(alice, "original", relpath)
 
     # the new content should appear in the 'recovery' folder
     await await_file_contents(
         recover_file.path,
-        content2,
+        _CONTENT_TWO,
     )
 
 
 @inline_callbacks
 @pytest_twisted.ensureDeferred
-async def test_internal_inconsistency(request, reactor, temp_filepath, alice, bob, take_snapshot):
+async def test_internal_inconsistency(request, reactor, recovery_dirs, alice, bob, take_snapshot):
     # FIXME needs docstring
-    original_folder = temp_filepath.child("cats")
-    recover_folder = temp_filepath.child("kitties")
-    original_folder.makedirs()
-    recover_folder.makedirs()
+    original_folder = recovery_dirs.original
+    recover_folder = recovery_dirs.recover
 
-    await alice.add(request, "internal", original_folder.path)
-    alice_folders = await alice.list_(True)
+    alice_folder = await alice.add(request, "internal", original_folder.path)
 
     # put a file in our folder
-    content0 = non_lit_content("zero")
-    original_folder.child("fluffy").setContent(content0)
+    original_folder.child("fluffy").setContent(_CONTENT_ZERO)
     await take_snapshot(alice, "internal", "fluffy")
 
     # create the 'rec' magic-folder
@@ -270,14 +316,13 @@ async def test_internal_inconsistency(request, reactor, temp_filepath, alice, bo
 
     # add the 'internal' magic-folder as a participant in the
     # 'rec' folder
-    alice_ro_cap = Capability.from_string(alice_folders["internal"]["upload_dircap"]).to_readonly()
-    await bob.add_participant("rec", "alice", alice_ro_cap.danger_real_capability_string())
+    await bob.add_participant("rec", "alice", alice_folder["readonly_cap"])
 
     # we should now see the only Snapshot we have in the folder appear
     # in the 'recovery' filesystem
     await await_file_contents(
         recover_folder.child("fluffy").path,
-        content0,
+        _CONTENT_ZERO,
         timeout=25,
     )
 
@@ -285,10 +330,9 @@ async def test_internal_inconsistency(request, reactor, temp_filepath, alice, bo
 
     try:
         # update the file (so now there's two versions)
-        content1 = non_lit_content("one")
-        original_folder.child("fluffy").setContent(content1)
+        original_folder.child("fluffy").setContent(_CONTENT_ONE)
         await take_snapshot(alice, "internal", "fluffy")
-        await twisted_sleep(reactor, 5)
+        await await_upload_complete(reactor, alice, "internal", "fluffy")
 
     finally:
         await bob.start_magic_folder()
@@ -297,26 +341,22 @@ async def test_internal_inconsistency(request, reactor, temp_filepath, alice, bo
     # in the 'recovery' filesystem
     await await_file_contents(
         recover_folder.child("fluffy").path,
-        content1,
+        _CONTENT_ONE,
         timeout=25,
     )
 
 
 @inline_callbacks
 @pytest_twisted.ensureDeferred
-async def test_ancestors(request, reactor, temp_filepath, alice, bob, take_snapshot):
-    original_folder = temp_filepath.child("cats")
-    recover_folder = temp_filepath.child("kitties")
-    original_folder.makedirs()
-    recover_folder.makedirs()
+async def test_ancestors(request, reactor, recovery_dirs, alice, bob, take_snapshot):
+    original_folder = recovery_dirs.original
+    recover_folder = recovery_dirs.recover
 
     # add our magic-folder and re-start
-    await alice.add(request, "ancestor0", original_folder.path)
-    alice_folders = await alice.list_(True)
+    alice_folder = await alice.add(request, "ancestor0", original_folder.path)
 
     # put a file in our folder
-    content0 = non_lit_content("zero")
-    original_folder.child("nyan").setContent(content0)
+    original_folder.child("nyan").setContent(_CONTENT_ZERO)
     await take_snapshot(alice, "ancestor0", "nyan")
 
     # create the 'ancestor1' magic-folder
@@ -324,25 +364,24 @@ async def test_ancestors(request, reactor, temp_filepath, alice, bob, take_snaps
 
     # add the 'ancestor0' magic-folder as a participant in the
     # 'ancestor1' folder
-    alice_cap = Capability.from_string(alice_folders["ancestor0"]["upload_dircap"]).to_readonly().danger_real_capability_string()
+    alice_cap = alice_folder["readonly_cap"]
     await bob.add_participant("ancestor1", "alice", alice_cap)
 
     # we should now see the only Snapshot we have in the folder appear
     # in the 'ancestor1' filesystem
     await await_file_contents(
         recover_folder.child("nyan").path,
-        content0,
+        _CONTENT_ZERO,
         timeout=25,
     )
 
     # update the file in bob's folder
-    content1 = non_lit_content("one")
-    recover_folder.child("nyan").setContent(content1)
+    recover_folder.child("nyan").setContent(_CONTENT_ONE)
     await take_snapshot(bob, "ancestor1", "nyan")
 
     await await_file_contents(
         recover_folder.child("nyan").path,
-        content1,
+        _CONTENT_ONE,
         timeout=25,
     )
     await ensure_file_not_created(
@@ -351,64 +390,55 @@ async def test_ancestors(request, reactor, temp_filepath, alice, bob, take_snaps
     )
 
     # update the file in alice's folder
-    content2 = non_lit_content("two")
-    original_folder.child("nyan").setContent(content2)
+    original_folder.child("nyan").setContent(_CONTENT_TWO)
     await take_snapshot(alice, "ancestor0", "nyan")
 
     # Since we made local changes to the file, a change to alice
     # shouldn't overwrite our changes
     await await_file_contents(
         recover_folder.child("nyan").path,
-        content1,
+        _CONTENT_ONE,
         timeout=25,
     )
 
 @inline_callbacks
 @pytest_twisted.ensureDeferred
-async def test_recover_twice(request, reactor, temp_filepath, alice, bob, edmond, take_snapshot):
-    original_folder = temp_filepath.child("cats")
-    recover_folder = temp_filepath.child("kitties")
+async def test_recover_twice(request, reactor, temp_filepath, recovery_dirs, alice, bob, edmond, take_snapshot):
+    original_folder = recovery_dirs.original
+    recover_folder = recovery_dirs.recover
     recover2_folder = temp_filepath.child("mice")
-    original_folder.makedirs()
-    recover_folder.makedirs()
     recover2_folder.makedirs()
 
     # add our magic-folder and re-start
-    await alice.add(request, "original", original_folder.path)
-    alice_folders = await alice.list_(True)
+    alice_folder = await alice.add(request, "original", original_folder.path)
 
     # put a file in our folder
-    content0 = non_lit_content("zero")
-    original_folder.child("pussyfoot").setContent(content0)
+    original_folder.child("pussyfoot").setContent(_CONTENT_ZERO)
     await take_snapshot(alice, "original", "pussyfoot")
 
-    await twisted_sleep(reactor, 5)
+    await await_upload_complete(reactor, alice, "original", "pussyfoot")
     await alice.stop_magic_folder()  # restarted on cleanup
 
-    def cleanup_restart_alice():
-        pytest_twisted.blockon(alice.start_magic_folder())
-    request.addfinalizer(cleanup_restart_alice)
+    restart_on_cleanup(request, alice)
 
     # create the 'recovery' magic-folder
-    await bob.add(request, "recovery", recover_folder.path)
-    bob_folders = await bob.list_(True)
+    bob_folder = await bob.add(request, "recovery", recover_folder.path)
 
     # add the 'original' magic-folder as a participant in the
     # 'recovery' folder
-    alice_cap = Capability.from_string(alice_folders["original"]["upload_dircap"]).to_readonly().danger_real_capability_string()
+    alice_cap = alice_folder["readonly_cap"]
     await bob.add_participant("recovery", "alice", alice_cap)
 
     # we should now see the only Snapshot we have in the folder appear
     # in the 'recovery' filesystem
     await await_file_contents(
         recover_folder.child("pussyfoot").path,
-        content0,
+        _CONTENT_ZERO,
         timeout=25,
     )
 
     # update the file (so now there's two versions)
-    content1 = non_lit_content("one")
-    recover_folder.child("pussyfoot").setContent(content1)
+    recover_folder.child("pussyfoot").setContent(_CONTENT_ONE)
     await take_snapshot(bob, "recovery", "pussyfoot")
 
     # We shouldn't see this show up as a conflict, since we are newer than
@@ -418,24 +448,22 @@ async def test_recover_twice(request, reactor, temp_filepath, alice, bob, edmond
         timeout=25,
     )
 
-    await twisted_sleep(reactor, 5)
+    await await_upload_complete(reactor, bob, "recovery", "pussyfoot")
     await bob.stop_magic_folder()  # restarted on cleanup
 
-    def cleanup_restart_bob():
-        pytest_twisted.blockon(bob.start_magic_folder())
-    request.addfinalizer(cleanup_restart_bob)
+    restart_on_cleanup(request, bob)
 
     # create the second 'recovery' magic-folder
     await edmond.add(request, "recovery-2", recover2_folder.path)
 
     # add the 'recovery' magic-folder as a participant in the
     # 'recovery-2' folder
-    bob_cap = Capability.from_string(bob_folders["recovery"]["upload_dircap"]).to_readonly().danger_real_capability_string()
+    bob_cap = bob_folder["readonly_cap"]
     await edmond.add_participant("recovery-2", "bob", bob_cap)
 
     await await_file_contents(
         recover2_folder.child("pussyfoot").path,
-        content1,
+        _CONTENT_ONE,
         timeout=25,
     )
 
@@ -443,24 +471,20 @@ async def test_recover_twice(request, reactor, temp_filepath, alice, bob, edmond
 @pytest.mark.parametrize("take_snapshot", [add_snapshot, scan_folder])
 @inline_callbacks
 @pytest_twisted.ensureDeferred
-async def test_unscanned_conflict(request, reactor, temp_filepath, alice, bob, take_snapshot):
+async def test_unscanned_conflict(request, reactor, recovery_dirs, alice, bob, take_snapshot):
     """
     If we make a change to a local file and a change to the same file on a
     peer, it is detected as a conflict, even if before we take a local snapshot
     of it.
     """
-    original_folder = temp_filepath.child("cats")
-    recover_folder = temp_filepath.child("kitties")
-    original_folder.makedirs()
-    recover_folder.makedirs()
+    original_folder = recovery_dirs.original
+    recover_folder = recovery_dirs.recover
 
     # add our magic-folder and re-start
-    await alice.add(request, "original", original_folder.path)
-    alice_folders = await alice.list_(True)
+    alice_folder = await alice.add(request, "original", original_folder.path)
 
     # put a file in our folder
-    content0 = non_lit_content("zero")
-    original_folder.child("cheshire").setContent(content0)
+    original_folder.child("cheshire").setContent(_CONTENT_ZERO)
     await take_snapshot(alice, "original", "cheshire")
 
     # create the 'recovery' magic-folder
@@ -468,32 +492,30 @@ async def test_unscanned_conflict(request, reactor, temp_filepath, alice, bob, t
 
     # add the 'original' magic-folder as a participant in the
     # 'recovery' folder
-    alice_cap = Capability.from_string(alice_folders["original"]["upload_dircap"]).to_readonly().danger_real_capability_string()
+    alice_cap = alice_folder["readonly_cap"]
     await bob.add_participant("recovery", "alice", alice_cap)
 
     # we should now see the only Snapshot we have in the folder appear
     # in the 'recovery' filesystem
     await await_file_contents(
         recover_folder.child("cheshire").path,
-        content0,
+        _CONTENT_ZERO,
         timeout=10,
     )
 
-    content1 = non_lit_content("one")
-    recover_folder.child("cheshire").setContent(content1)
+    recover_folder.child("cheshire").setContent(_CONTENT_ONE)
 
-    content2 = non_lit_content("two")
-    original_folder.child("cheshire").setContent(content2)
+    original_folder.child("cheshire").setContent(_CONTENT_TWO)
     await take_snapshot(alice, "original", "cheshire")
 
     await await_file_contents(
         recover_folder.child("cheshire.conflict-alice").path,
-        content2,
+        _CONTENT_TWO,
         timeout=10,
     )
     await await_file_contents(
         recover_folder.child("cheshire").path,
-        content1,
+        _CONTENT_ONE,
         timeout=10,
     )
 
@@ -501,22 +523,18 @@ async def test_unscanned_conflict(request, reactor, temp_filepath, alice, bob, t
 @pytest.mark.parametrize("take_snapshot", [add_snapshot, scan_folder])
 @inline_callbacks
 @pytest_twisted.ensureDeferred
-async def test_unscanned_vs_old(request, reactor, temp_filepath, alice, bob, take_snapshot):
+async def test_unscanned_vs_old(request, reactor, recovery_dirs, alice, bob, take_snapshot):
     """
     If we make a change to a local file, it is not detected as a conflict.
     """
-    original_folder = temp_filepath.child("cats")
-    recover_folder = temp_filepath.child("kitties")
-    original_folder.makedirs()
-    recover_folder.makedirs()
+    original_folder = recovery_dirs.original
+    recover_folder = recovery_dirs.recover
 
     # add our magic-folder and re-start
-    await alice.add(request, "original", original_folder.path)
-    alice_folders = await alice.list_(True)
+    alice_folder = await alice.add(request, "original", original_folder.path)
 
     # put a file in our folder
-    content0 = non_lit_content("zero")
-    original_folder.child("claude").setContent(content0)
+    original_folder.child("claude").setContent(_CONTENT_ZERO)
     await take_snapshot(alice, "original", "claude")
 
     # create the 'recovery' magic-folder
@@ -524,19 +542,18 @@ async def test_unscanned_vs_old(request, reactor, temp_filepath, alice, bob, tak
 
     # add the 'original' magic-folder as a participant in the
     # 'recovery' folder
-    alice_cap = Capability.from_string(alice_folders["original"]["upload_dircap"]).to_readonly().danger_real_capability_string()
+    alice_cap = alice_folder["readonly_cap"]
     await bob.add_participant("recovery", "alice", alice_cap)
 
     # we should now see the only Snapshot we have in the folder appear
     # in the 'recovery' filesystem
     await await_file_contents(
         recover_folder.child("claude").path,
-        content0,
+        _CONTENT_ZERO,
         timeout=10,
     )
 
-    content1 = non_lit_content("one")
-    recover_folder.child("claude").setContent(content1)
+    recover_folder.child("claude").setContent(_CONTENT_ONE)
 
     await ensure_file_not_created(
         recover_folder.child("claude.conflict-alice").path,
@@ -544,7 +561,7 @@ async def test_unscanned_vs_old(request, reactor, temp_filepath, alice, bob, tak
     )
     await await_file_contents(
         recover_folder.child("claude").path,
-        content1,
+        _CONTENT_ONE,
         timeout=10,
     )
 
@@ -552,22 +569,18 @@ async def test_unscanned_vs_old(request, reactor, temp_filepath, alice, bob, tak
 @pytest.mark.parametrize("take_snapshot", [add_snapshot, scan_folder])
 @inline_callbacks
 @pytest_twisted.ensureDeferred
-async def test_delete(request, reactor, temp_filepath, alice, bob, take_snapshot):
+async def test_delete(request, reactor, recovery_dirs, alice, bob, take_snapshot):
     """
     A delete to a local file is stored and synchronized
     """
-    original_folder = temp_filepath.child("cats")
-    recover_folder = temp_filepath.child("kitties")
-    original_folder.makedirs()
-    recover_folder.makedirs()
+    original_folder = recovery_dirs.original
+    recover_folder = recovery_dirs.recover
 
     # add our magic-folder and re-start
-    await alice.add(request, "original", original_folder.path)
-    alice_folders = await alice.list_(True)
+    alice_folder = await alice.add(request, "original", original_folder.path)
 
     # put a file in our folder
-    content0 = non_lit_content("zero")
-    original_folder.child("jerry").setContent(content0)
+    original_folder.child("jerry").setContent(_CONTENT_ZERO)
     await take_snapshot(alice, "original", "jerry")
 
     # create the 'recovery' magic-folder
@@ -575,14 +588,14 @@ async def test_delete(request, reactor, temp_filepath, alice, bob, take_snapshot
 
     # add the 'original' magic-folder as a participant in the
     # 'recovery' folder
-    alice_cap = Capability.from_string(alice_folders["original"]["upload_dircap"]).to_readonly().danger_real_capability_string()
+    alice_cap = alice_folder["readonly_cap"]
     await bob.add_participant("recovery", "alice", alice_cap)
 
     # we should now see the only Snapshot we have in the folder appear
     # in the 'recovery' filesystem
     await await_file_contents(
         recover_folder.child("jerry").path,
-        content0,
+        _CONTENT_ZERO,
         timeout=10,
     )
 
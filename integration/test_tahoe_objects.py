@@ -3,6 +3,8 @@ from twisted.python.filepath import (
 )
 from twisted.internet.defer import (
     DeferredList,
+    DeferredSemaphore,
+    gatherResults,
 )
 
 import pytest_twisted
@@ -49,24 +51,37 @@ async def test_list_tahoe_objects(request, reactor, tahoe_venv, base_dir, introd
     number_of_folders = 20
     folder_names = ["workstuff{}".format(n) for n in range(number_of_folders)]
 
-    # make a bunch of folders
-    for folder_name in folder_names:
-        magic_dir = FilePath(base_dir).child(folder_name)
+    # make a bunch of folders; the directories are created up-front
+    # so that all the API calls can be made concurrently
+    magic_dirs = [
+        FilePath(base_dir).child(folder_name)
+        for folder_name in folder_names
+    ]
+    for magic_dir in magic_dirs:
         magic_dir.makedirs()
 
-        await yolandi.client.add_folder(
-            folder_name,
-            author_name="yolandi",
-            local_path=magic_dir,
-            poll_interval=10,
-            scan_interval=10,
-        )
+    await DeferredList(
+        [
+            yolandi.client.add_folder(
+                folder_name,
+                author_name="yolandi",
+                local_path=magic_dir,
+                poll_interval=10,
+                scan_interval=10,
+            )
+            for folder_name, magic_dir in zip(folder_names, magic_dirs)
+        ],
+        fireOnOneErrback=True,
+        consumeErrors=True,
+    )
+
+    status = await yolandi.status_stream()
+    request.addfinalizer(status.close)
 
     # concurrently put 1 file into each folder and immediately create
     # a snapshot for it via an API call
     files = []
-    for folder_num, folder_name in enumerate(folder_names):
-        magic_dir = FilePath(base_dir).child(folder_name)
+    for folder_num, (folder_name, magic_dir) in enumerate(zip(folder_names, magic_dirs)):
         with magic_dir.child("a_file_name").open("w") as f:
             f.write("data {:02d}\n".format(folder_num).encode("utf8") * 100)
         files.append(
@@ -103,31 +118,38 @@ async def test_list_tahoe_objects(request, reactor, tahoe_venv, base_dir, introd
         )
     )
 
+    # don't saturate the magic-folder API with every query at once
+    query_limit = DeferredSemaphore(8)
+
+    def query_tahoe_objects():
+        # if any of the queries fail, we fail the test
+        return gatherResults(
+            [
+                query_limit.run(yolandi.client.tahoe_objects, folder_name)
+                for folder_name in folder_names
+            ],
+            consumeErrors=True,
+        )
+
+    def all_uploaded(events):
+        return all(
+            "a_file_name" in util.uploads_finished(events, folder_name)
+            for folder_name in folder_names
+        )
+
     # try for 15 seconds to get what we expect. we're waiting for each
     # of the magic-folders to upload their single "a_file_name" items
-    # so that they each have one Snapshot in Tahoe-LAFS
-    for _ in range(15):
-        await util.twisted_sleep(reactor, 1)
-        results = await DeferredList([
-            yolandi.client.tahoe_objects(folder_name)
-            for folder_name in folder_names
-        ])
-        # if any of the queries fail, we fail the test
-        errors = [
-            fail
-            for ok, fail in results
-            if not ok
-        ]
-        assert errors == [], "At least one /tahoe-objects query failed"
-
-        actual_results = [
-            result
-            for ok, result in results
-            if ok
-        ]
-        # exit early if we'll pass the test
-        if matches_expected_results.match(actual_results) is None:
-            break
+    # so that they each have one Snapshot in Tahoe-LAFS. The status
+    # stream tells us when that has happened, so we only need to
+    # query /tahoe-objects again if it is somehow not visible yet.
+    await status.wait_for(all_uploaded, timeout=15)
+    actual_results = await util.poll_until(
+        reactor,
+        query_tahoe_objects,
+        lambda results: matches_expected_results.match(results) is None,
+        timeout=5,
+        interval=0.5,
+    )
 
     # check the results
     assert_that(actual_results, matches_expected_results)
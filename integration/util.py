@@ -23,6 +23,7 @@ from twisted.internet.defer import (
     returnValue,
     Deferred,
     maybeDeferred,
+    succeed,
 )
 from twisted.internet.error import (
     ProcessTerminated,
@@ -313,7 +314,8 @@ class MagicFolderEnabledNode(object):
         yield _magic_folder_runner(self.reactor, self.request, self.name, args)
 
 
-    def add(self, request, folder_name, magic_directory, author=None, poll_interval=5, scan_interval=None, cleanup=True, restart_on_cleanup=False):
+    @inline_callbacks
+    def add(self, request, folder_name, magic_directory, author=None, poll_interval=5, scan_interval=None, cleanup=True, restart=False):
         """
         magic-folder add
 
@@ -321,6 +323,12 @@ class MagicFolderEnabledNode(object):
         folder will be removed (that is, in the scope of that request
         and _not_ the typically session request that our self.request
         one is)
+
+        :returns Deferred[dict]: the capability-strings of the new
+            folder: ``"upload_dircap"`` (our Personal DMD) and its
+            read-only version, ``"readonly_cap"``. These are read from
+            the folder's state database, saving a ``magic-folder list``
+            run just to find them.
         """
         args = [
             "--config",
@@ -344,23 +352,20 @@ class MagicFolderEnabledNode(object):
             magic_directory,
         ]
 
-        def _do_cleanup():
-            # Maybe start the service, so we can remove the folder.
-            if restart_on_cleanup:
-                pytest_twisted.blockon(self.start_magic_folder())
-            try:
-                pytest_twisted.blockon(self.leave(folder_name))
-            except ProcessTerminated:
-                pass  # Already left, that's okay
         if cleanup:
-            request.addfinalizer(_do_cleanup)
+            leave_on_cleanup(request, self, folder_name, restart=restart)
 
-        return _magic_folder_runner(
+        yield _magic_folder_runner(
             self.reactor,
             self.request,
             self.name,
             args,
         )
+        upload_dircap = self.global_config().get_magic_folder(folder_name).upload_dircap
+        returnValue({
+            "upload_dircap": upload_dircap.danger_real_capability_string(),
+            "readonly_cap": upload_dircap.to_readonly().danger_real_capability_string(),
+        })
 
     def leave(self, folder_name):
         """
@@ -568,9 +573,12 @@ class MagicFolderEnabledNode(object):
             ],
         )
 
-    def scan(self, folder_name):
+    def scan(self, folder_name, paths=()):
         """
         magic-folder-api scan
+
+        :param paths: if given, only scan these paths (relative to the
+            magic-folder) rather than the whole folder.
         """
         return _magic_folder_api_runner(
             self.reactor, self.request, self.name,
@@ -578,12 +586,14 @@ class MagicFolderEnabledNode(object):
                 "--config", self.magic_config_directory,
                 "scan",
                 "--folder", folder_name,
-            ],
+            ] + list(paths),
         )
 
     def status(self):
         """
         magic-folder-api monitor --once
+
+        :returns Deferred[dict]: the parsed status.
         """
         return _magic_folder_api_runner(
             self.reactor, self.request, self.name,
@@ -592,14 +602,15 @@ class MagicFolderEnabledNode(object):
                 "monitor",
                 "--once",
             ],
-        )
+        ).addCallback(json.loads)
 
     @inline_callbacks
-    def status_monitor(self, how_long):
+    def status_stream(self):
         """
-        collect the output of `magic-folder-api monitor` for `how_long`
-        seconds and return all the output (as a list of JSON-decoded
-        events)
+        Connect to the status WebSocket of our magic-folder.
+
+        :returns Deferred[StatusStream]: collecting every event sent
+            from now on (starting with the current state).
         """
         # FIXME: should use FilePath throughout this class
         config = FilePath(self.magic_config_directory)
@@ -620,16 +631,20 @@ class MagicFolderEnabledNode(object):
                 }
             }
         )
-        messages = []
-
-        def foo(data, is_binary=False):
-            msg = json.loads(data.decode("utf8"))
-            messages.extend(msg["events"])
-        proto.on("message", foo)
+        returnValue(StatusStream(self.reactor, proto))
 
+    @inline_callbacks
+    def status_monitor(self, how_long):
+        """
+        collect the output of `magic-folder-api monitor` for `how_long`
+        seconds and return all the output (as a list of JSON-decoded
+        events)
+        """
+        stream = yield self.status_stream()
         # collect some messages
         yield deferLater(self.reactor, how_long)
-        returnValue(messages)
+        stream.close()
+        returnValue(stream.events)
 
     def dump_state(self, folder_name):
         """
@@ -645,6 +660,115 @@ class MagicFolderEnabledNode(object):
         )
 
 
+@attr.s
+class StatusStream(object):
+    """
+    Collect every event sent over a status WebSocket (see
+    ``MagicFolderEnabledNode.status_stream``) so that tests can react
+    to state changes as they happen instead of re-querying.
+
+    :ivar list events: every event received so far, in order.
+    """
+    _reactor = attr.ib()
+    _protocol = attr.ib()
+    events = attr.ib(init=False, default=attr.Factory(list))
+    _waiting = attr.ib(init=False, default=attr.Factory(list))
+
+    def __attrs_post_init__(self):
+        self._protocol.on("message", self._message_received)
+
+    def _message_received(self, data, is_binary=False):
+        msg = json.loads(data.decode("utf8"))
+        self.events.extend(msg["events"])
+        waiting, self._waiting = self._waiting, []
+        for until, d in waiting:
+            if until(self.events):
+                d.callback(self.events)
+            else:
+                self._waiting.append((until, d))
+
+    def wait_for(self, until, timeout=10):
+        """
+        Wait until `until`, passed the list of all events received so
+        far, returns True. It is re-checked each time a message arrives.
+
+        :returns Deferred[list]: fires with all the events received so
+            far; this happens after `timeout` seconds in any case, so
+            callers are still expected to assert on the result.
+        """
+        if until(self.events):
+            return succeed(self.events)
+        d = Deferred()
+        waiter = (until, d)
+        self._waiting.append(waiter)
+
+        def timed_out():
+            if waiter in self._waiting:
+                self._waiting.remove(waiter)
+                d.callback(self.events)
+        timer = self._reactor.callLater(timeout, timed_out)
+
+        def cancel_timer(result):
+            if timer.active():
+                timer.cancel()
+            return result
+        return d.addBoth(cancel_timer)
+
+    def close(self):
+        self._protocol.sendClose()
+
+
+def uploads_finished(events, folder_name):
+    """
+    :param list events: status events, as collected by ``StatusStream``
+
+    :returns set: every relpath in `folder_name` which the events
+        say has finished uploading.
+    """
+    return {
+        event["relpath"]
+        for event in events
+        if event["kind"] == "upload-finished" and event["folder"] == folder_name
+    }
+
+
+def leave_on_cleanup(request, node, folder_name, restart=False):
+    """
+    Arrange for `node` to leave the folder `folder_name` when the scope
+    of `request` ends.
+
+    Each call adds its own finalizer, so folders are left in the
+    reverse order to their registration, like any other pytest
+    cleanup.
+
+    :param MagicFolderEnabledNode node: The node which has the folder.
+    :param bool restart: If True, start the node's magic-folder
+        service (if it isn't running) before leaving, so that the
+        folder can be removed.
+    """
+    def cleanup():
+        if restart:
+            # Maybe start the service, so we can remove the folder.
+            pytest_twisted.blockon(node.start_magic_folder())
+        try:
+            pytest_twisted.blockon(node.leave(folder_name))
+        except ProcessTerminated:
+            pass  # Already left, that's okay
+    request.addfinalizer(cleanup)
+
+
+def restart_on_cleanup(request, node):
+    """
+    Arrange for the magic-folder service of `node` to be started again
+    (if it isn't running) when the scope of `request` ends.
+
+    :param MagicFolderEnabledNode node: The node to restart.
+    """
+    request.addfinalizer(
+        lambda: pytest_twisted.blockon(node.start_magic_folder())
+    )
+
+
 @attr.s
 class WormholeMailboxServer:
     """
@@ -1228,22 +1352,34 @@ def find_conflicts(path):
     ]
 
 
+# How long to wait for synchronized files to show up, when a test
+# doesn't say. Slow CI machines may want more than the default.
+_DEFAULT_FILE_TIMEOUT = float(os.environ.get("MAGIC_FOLDER_TEST_TIMEOUT", "15"))
+
+
 @log_inline_callbacks(action_type=u"integration:await-file-contents", include_args=True)
-def await_file_contents(path, contents, timeout=15):
+def await_file_contents(path, contents, timeout=None, interval=0.1):
     """
     Return a deferred that fires when the file at `path` (any path-like
     object) has the exact content `contents`.
 
+    :param timeout: seconds to wait; defaults to the
+        ``MAGIC_FOLDER_TEST_TIMEOUT`` environment variable (or 15).
+    :param interval: seconds between checks of the file.
+
     :raises ExpectedFileMismatchException: if the path doesn't have the
         expected content after the timeout.
     :raises ExpectedFileUnfoundException: if the path doesn't exist after the
         the timeout.
     """
     assert isinstance(contents, bytes), "file-contents must be bytes"
+    if timeout is None:
+        timeout = _DEFAULT_FILE_TIMEOUT
     from twisted.internet import reactor
     start_time = reactor.seconds()
+    print("  waiting for '{}'".format(path))
+    last = None
     while reactor.seconds() - start_time < timeout:
-        print("  waiting for '{}'".format(path))
         if exists(path):
             try:
                 with open(path, 'rb') as f:
@@ -1253,20 +1389,24 @@ def await_file_contents(path, contents, timeout=15):
             else:
                 if current == contents:
                     return
-                print("  file contents still mismatched")
-                # annoying if we dump huge files to console
-                if len(contents) < 80:
-                    print("  wanted: {}".format(contents.decode("utf8").replace('\n', ' ')))
-                    print("     got: {}".format(current.decode("utf8").replace('\n', ' ')))
-                log_message(
-                    message_type=u"integration:await-file-contents:mismatched",
-                    got=current.decode("utf8"),
-                )
-        else:
+                # only report each wrong version once, since we check often
+                if current != last:
+                    last = current
+                    print("  file contents still mismatched")
+                    # annoying if we dump huge files to console
+                    if len(contents) < 80:
+                        print("  wanted: {}".format(contents.decode("utf8").replace('\n', ' ')))
+                        print("     got: {}".format(current.decode("utf8").replace('\n', ' ')))
+                    log_message(
+                        message_type=u"integration:await-file-contents:mismatched",
+                        got=current.decode("utf8"),
+                    )
+        elif last is None:
+            last = b""
             log_message(
                 message_type=u"integration:await-file-contents:missing",
             )
-        yield twisted_sleep(reactor, 1)
+        yield twisted_sleep(reactor, interval)
     if exists(path):
         raise ExpectedFileMismatchException(path, timeout)
     raise ExpectedFileUnfoundException(path, timeout)
@@ -1369,6 +1509,71 @@ def twisted_sleep(reactor, timeout):
     return deferLater(reactor, timeout, lambda: None)
 
 
+@inline_callbacks
+def poll_until(reactor, query, until, timeout=10, interval=0.1):
+    """
+    Call `query` repeatedly until `until` is true for its result, or
+    until `timeout` seconds have passed.
+
+    Unlike a fixed sleep-then-check loop this wakes up every
+    `interval` seconds, so we return shortly after the state we're
+    waiting for is reached. Callers are still expected to assert on
+    the returned value, since it is also returned after the timeout.
+
+    :param query: a no-argument callable, which may return a Deferred
+        or a coroutine.
+    :param until: a one-argument callable, passed each result from
+        `query`; returns True when we are done.
+
+    :returns Deferred: fires with the last result of `query`
+    """
+    start = reactor.seconds()
+    while True:
+        value = yield maybeDeferred(query)
+        if until(value) or reactor.seconds() - start >= timeout:
+            returnValue(value)
+        yield twisted_sleep(reactor, interval)
+
+
+def await_upload_complete(reactor, node, folder_name, relpath, timeout=20):
+    """
+    Wait until every LocalSnapshot of `relpath` in the folder
+    `folder_name` on `node` has been uploaded.
+
+    LocalSnapshots are only removed from the state database once the
+    upload is done and our Personal DMD points at the new Snapshot, so
+    we wait until there are none left and a remote Snapshot exists.
+
+    :raises RuntimeError: if the upload isn't complete after `timeout`
+        seconds.
+    """
+    folder_config = node.global_config().get_magic_folder(folder_name)
+
+    def uploaded():
+        try:
+            if relpath in folder_config.get_all_localsnapshot_paths():
+                return False
+            folder_config.get_remotesnapshot(relpath)
+        except sqlite3.OperationalError as e:
+            # production code is using the database too
+            print("sqlite3.OperationalError while checking uploads: {}".format(e))
+            return False
+        except KeyError:
+            return False
+        return True
+
+    def check(done):
+        if not done:
+            raise RuntimeError(
+                "'{}' in '{}' on {} not uploaded after {}s".format(
+                    relpath, folder_name, node.name, timeout,
+                )
+            )
+    d = poll_until(reactor, uploaded, bool, timeout=timeout, interval=0.2)
+    d.addCallback(check)
+    return d
+
+
 def sleep(timeout):
     """
     Sleep for the given amount of time, letting the pytest-twisted reactor run.
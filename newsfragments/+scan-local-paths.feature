@@ -0,0 +1 @@
+``PUT /v1/magic-folder/<folder-name>/scan-local`` now accepts an optional JSON body ``{"paths": [...]}`` to scan only some paths, and ``magic-folder-api scan`` accepts those paths as positional arguments.
@@ -20,7 +20,6 @@ from twisted.python.filepath import (
 )
 from twisted.internet.defer import (
     maybeDeferred,
-    inlineCallbacks,
 )
 
 from .cli import (
@@ -33,6 +32,9 @@ from .client import (
 from .util.file import (
     ns_to_seconds_float,
 )
+from .util.twisted import (
+    async_to_deferred,
+)
 from .util.eliotutil import maybe_enable_eliot_logging, with_eliot_options
 
 
@@ -50,12 +52,11 @@ class CancelInviteOptions(usage.Options):
             raise usage.UsageError("--invite / -i is required")
 
 
-@inlineCallbacks
-def cancel_invite(options):
+async def cancel_invite(options):
     """
     Cancel a pending invite in a folder
     """
-    res = yield options.parent.client.cancel_invite(
+    res = await options.parent.client.cancel_invite(
         options['folder'],
         options['invite'],
     )
@@ -73,12 +74,11 @@ class ListInvitesOptions(usage.Options):
             raise usage.UsageError("--folder / -n is required")
 
 
-@inlineCallbacks
-def list_invites(options):
+async def list_invites(options):
     """
     List all pending invites for a folder
     """
-    res = yield options.parent.client.list_invites(
+    res = await options.parent.client.list_invites(
         options['folder'],
     )
     print(json.dumps(res, indent=4), file=options.stdout)
@@ -99,12 +99,11 @@ class CreateInviteOptions(usage.Options):
             raise usage.UsageError("--participant-name / -p is required")
 
 
-@inlineCallbacks
-def create_invite(options):
+async def create_invite(options):
     """
     Create a new invite for a folder
     """
-    res = yield options.parent.client.invite(
+    res = await options.parent.client.invite(
         options['folder'],
         options['participant-name'],
         options['mode'],
@@ -124,12 +123,11 @@ class AwaitInviteOptions(usage.Options):
             raise usage.UsageError("--folder / -n is required")
 
 
-@inlineCallbacks
-def await_invite(options):
+async def await_invite(options):
     """
     Await a new invite for a folder
     """
-    res = yield options.parent.client.invite_wait(
+    res = await options.parent.client.invite_wait(
         options['folder'],
         options['id'],
     )
@@ -162,12 +160,11 @@ class AcceptInviteOptions(usage.Options):
                 raise usage.UsageError("--{} / -{} is required".format(large, smol))
 
 
-@inlineCallbacks
-def accept_invite(options):
+async def accept_invite(options):
     """
     Accept a new invite for a folder
     """
-    res = yield options.parent.client.join(
+    res = await options.parent.client.join(
         options['folder'],
         options['code'],
         options['local-dir'],
@@ -193,17 +190,16 @@ class AddSnapshotOptions(usage.Options):
             raise usage.UsageError("--folder / -n is required")
 
 
-@inlineCallbacks
-def add_snapshot(options):
+async def add_snapshot(options):
     """
     Add one new Snapshot of a particular file in a particular
     magic-folder.
     """
-    res = yield options.parent.client.add_snapshot(
+    res = await options.parent.client.add_snapshot(
         options['folder'],
         options['file'],
     )
-    print("{}".format(res), file=options.stdout)
+    print(res, file=options.stdout)
 
 
 class FileStatusOptions(usage.Options):
@@ -217,12 +213,11 @@ class FileStatusOptions(usage.Options):
             raise usage.UsageError("--folder / -n is required")
 
 
-@inlineCallbacks
-def file_status(options):
+async def file_status(options):
     """
     List the status of all files in a magic-folder
     """
-    res = yield options.parent.client.file_status(
+    res = await options.parent.client.file_status(
         options['folder'],
     )
     print(json.dumps(res, indent=2), file=options.stdout)
@@ -311,17 +306,16 @@ class AddParticipantOptions(usage.Options):
                 raise usage.UsageError(error)
 
 
-@inlineCallbacks
-def add_participant(options):
+async def add_participant(options):
     """
     Add one new participant to an existing magic-folder
     """
-    res = yield options.parent.client.add_participant(
+    res = await options.parent.client.add_participant(
         options['folder'],
         options['author-name'],
         options['personal-dmd'],
     )
-    print("{}".format(res), file=options.stdout)
+    print(res, file=options.stdout)
 
 
 class ListParticipantsOptions(usage.Options):
@@ -338,15 +332,14 @@ class ListParticipantsOptions(usage.Options):
                 raise usage.UsageError(error)
 
 
-@inlineCallbacks
-def list_participants(options):
+async def list_participants(options):
     """
     List all participants in a magic-folder
     """
-    res = yield options.parent.client.list_participants(
+    res = await options.parent.client.list_participants(
         options['folder'],
     )
-    print("{}".format(json.dumps(res, indent=4)), file=options.stdout)
+    print(json.dumps(res, indent=4), file=options.stdout)
 
 
 class ListConflictsOptions(usage.Options):
@@ -363,15 +356,14 @@ class ListConflictsOptions(usage.Options):
                 raise usage.UsageError(error)
 
 
-@inlineCallbacks
-def list_conflicts(options):
+async def list_conflicts(options):
     """
     List all conflicts in a magic-folder
     """
-    res = yield options.parent.client.list_conflicts(
+    res = await options.parent.client.list_conflicts(
         options['folder'],
     )
-    print("{}".format(json.dumps(res, indent=4)), file=options.stdout)
+    print(json.dumps(res, indent=4), file=options.stdout)
 
 
 class ScanOptions(usage.Options):
@@ -379,6 +371,13 @@ class ScanOptions(usage.Options):
         ("folder", "n", None, "Name of the magic-folder to scan", str),
     ]
 
+    def getSynopsis(self):
+        return "Usage: magic-folder-api scan [options] [<relpath> ...]"
+
+    def parseArgs(self, *paths):
+        # with no paths, the whole folder is scanned
+        self["paths"] = list(paths) if paths else None
+
     def postOptions(self):
         required_args = [
             ("folder", "--folder / -n is required"),
@@ -390,6 +389,7 @@ class ScanOptions(usage.Options):
 def scan(options):
     return options.parent.client.scan_folder_local(
         options['folder'],
+        options['paths'],
     )
 
 
@@ -438,8 +438,7 @@ class StatusProtocol(WebSocketClientProtocol):
             self.sendClose()
 
 
-@inlineCallbacks
-def monitor(options):
+async def monitor(options):
     """
     Print out updates from the WebSocket status API
     """
@@ -448,7 +447,7 @@ def monitor(options):
     websocket_uri = "{}/v1/status".format(endpoint_str.replace("tcp:", "ws://"))
 
     agent = options.parent.get_websocket_agent()
-    proto = yield agent.open(
+    proto = await agent.open(
         websocket_uri,
         {
             "headers": {
@@ -460,7 +459,7 @@ def monitor(options):
             single_message=options['once'],
         )
     )
-    yield proto.is_closed
+    await proto.is_closed
 
 
 @with_eliot_options
@@ -476,25 +475,25 @@ class MagicFolderApiCommand(BaseOptions):
             self._websocket_agent = create_client_agent(reactor)
         return self._websocket_agent
 
-    subCommands = [
-        ["add-snapshot", None, AddSnapshotOptions, "Add a Snapshot of a file to a magic-folder."],
-        ["file-status", None, FileStatusOptions, "List status of all files in a magic-folder."],
-        ["dump-state", None, DumpStateOptions, "Dump the local state of a magic-folder."],
-        ["add-participant", None, AddParticipantOptions, "Add a Participant to a magic-folder."],
-        ["list-participants", None, ListParticipantsOptions, "List all Participants in a magic-folder."],
-        ["list-conflicts", None, ListConflictsOptions, "List all conflicts in a magic-folder."],
-        ["scan", None, ScanOptions, "Scan for local changes in a magic-folder."],
-        ["poll", None, PollOptions, "Poll for remote changes in a magic-folder."],
-        ["monitor", None, MonitorOptions, "Monitor status updates."],
-        ["list-invites", None, ListInvitesOptions, "List all invites in a magic-folder."],
-        ["create-invite", None, CreateInviteOptions, "Create an invite in a magic-folder."],
-        ["await-invite", None, AwaitInviteOptions, "Wait for an invite to be resolved."],
-        ["accept-invite", None, AcceptInviteOptions, "Accept an invite (creating a magic-folder)."],
-        ["cancel-invite", None, CancelInviteOptions, "Cancel a pending invite."],
-    ]
-    optFlags = [
-        ["debug", "d", "Print full stack-traces"],
-    ]
+    subCommands = (
+        ("add-snapshot", None, AddSnapshotOptions, "Add a Snapshot of a file to a magic-folder."),
+        ("file-status", None, FileStatusOptions, "List status of all files in a magic-folder."),
+        ("dump-state", None, DumpStateOptions, "Dump the local state of a magic-folder."),
+        ("add-participant", None, AddParticipantOptions, "Add a Participant to a magic-folder."),
+        ("list-participants", None, ListParticipantsOptions, "List all Participants in a magic-folder."),
+        ("list-conflicts", None, ListConflictsOptions, "List all conflicts in a magic-folder."),
+        ("scan", None, ScanOptions, "Scan for local changes in a magic-folder."),
+        ("poll", None, PollOptions, "Poll for remote changes in a magic-folder."),
+        ("monitor", None, MonitorOptions, "Monitor status updates."),
+        ("list-invites", None, ListInvitesOptions, "List all invites in a magic-folder."),
+        ("create-invite", None, CreateInviteOptions, "Create an invite in a magic-folder."),
+        ("await-invite", None, AwaitInviteOptions, "Wait for an invite to be resolved."),
+        ("accept-invite", None, AcceptInviteOptions, "Accept an invite (creating a magic-folder)."),
+        ("cancel-invite", None, CancelInviteOptions, "Cancel a pending invite."),
+    )
+    optFlags = (
+        ("debug", "d", "Print full stack-traces"),
+    )
     description = (
         "Convenience wrappers around the Magic Folder local "
         "HTTP API. Handles authentication and encoding"
@@ -513,7 +512,7 @@ class MagicFolderApiCommand(BaseOptions):
         Display magic-folder version and exit.
         """
         from . import __version__
-        print("magic-folder-api version {}".format(__version__), file=self.stdout)
+        print(f"magic-folder-api version {__version__}", file=self.stdout)
         sys.exit(0)
 
     def postOptions(self):
@@ -532,9 +531,9 @@ class MagicFolderApiCommand(BaseOptions):
         return t
 
 
-@inlineCallbacks
-def dispatch_magic_folder_api_command(args, stdout=None, stderr=None, client=None,
-                                      websocket_agent=None, config=None):
+@async_to_deferred
+async def dispatch_magic_folder_api_command(args, stdout=None, stderr=None, client=None,
+                                            websocket_agent=None, config=None):
     """
     Run a magic-folder-api command with the given args
 
@@ -573,19 +572,40 @@ def dispatch_magic_folder_api_command(args, stdout=None, stderr=None, client=Non
     try:
         options.parseOptions(args)
     except usage.UsageError as e:
-        print("Error: {}".format(e), file=options.stdout)
+        message = f"Error: {e}\n"
         # if a user just typed "magic-folder-api" don't make them re-run
         # with "--help" just to see the sub-commands they were
         # supposed to use
         if len(args) == 0:
-            print(options, file=options.stdout)
+            message += f"{options}\n"
+        options.stdout.write(message)
         raise SystemExit(1)
 
-    yield run_magic_folder_api_options(options)
+    await run_magic_folder_api_options(options)
+
+
+# maps each subcommand (see MagicFolderApiCommand.subCommands) to the
+# function implementing it
+_subcommand_functions = {
+    "add-snapshot": add_snapshot,
+    "file-status": file_status,
+    "dump-state": dump_state,
+    "add-participant": add_participant,
+    "list-participants": list_participants,
+    "list-conflicts": list_conflicts,
+    "scan": scan,
+    "poll": poll,
+    "monitor": monitor,
+    "list-invites": list_invites,
+    "create-invite": create_invite,
+    "await-invite": await_invite,
+    "accept-invite": accept_invite,
+    "cancel-invite": cancel_invite,
+}
 
 
-@inlineCallbacks
-def run_magic_folder_api_options(options):
+@async_to_deferred
+async def run_magic_folder_api_options(options):
     """
     Runs a magic-folder-api subcommand with the provided options.
 
@@ -597,38 +617,25 @@ def run_magic_folder_api_options(options):
     so = options.subOptions
     so.stdout = options.stdout
     so.stderr = options.stderr
-    main_func = {
-        "add-snapshot": add_snapshot,
-        "file-status": file_status,
-        "dump-state": dump_state,
-        "add-participant": add_participant,
-        "list-participants": list_participants,
-        "list-conflicts": list_conflicts,
-        "scan": scan,
-        "poll": poll,
-        "monitor": monitor,
-        "list-invites": list_invites,
-        "create-invite": create_invite,
-        "await-invite": await_invite,
-        "accept-invite": accept_invite,
-        "cancel-invite": cancel_invite,
-    }[options.subCommand]
+    main_func = _subcommand_functions[options.subCommand]
 
     maybe_enable_eliot_logging(options)
 
     # we want to let exceptions out to the top level if --debug is on
     # because this gives better stack-traces
     if options['debug']:
-        yield maybeDeferred(main_func, so)
+        await maybeDeferred(main_func, so)
 
     else:
         try:
-            yield maybeDeferred(main_func, so)
+            await maybeDeferred(main_func, so)
 
         except CannotAccessAPIError as e:
             # give user more information if we can't find the daemon at all
-            print(u"Error: {}".format(e), file=options.stderr)
-            print(u"   Attempted access via {}".format(options.api_client_endpoint), file=options.stderr)
+            options.stderr.write(
+                f"Error: {e}\n"
+                f"   Attempted access via {options.api_client_endpoint}\n"
+            )
             raise SystemExit(1)
 
         except MagicFolderApiError as e:
@@ -637,7 +644,7 @@ def run_magic_folder_api_options(options):
             raise SystemExit(2)
 
         except Exception as e:
-            print(u"Error: {}".format(e), file=options.stderr)
+            print(f"Error: {e}", file=options.stderr)
             raise SystemExit(3)
 
 
@@ -648,6 +655,11 @@ def _entry():
     :return: ``None``
     """
 
+    # NOTE: this runs on the platform's default reactor (epoll on
+    # Linux). An alternative such as asyncioreactor can't be installed
+    # here, since importing this module (klein, via .cli) has already
+    # installed the default one -- and a single HTTP request wouldn't
+    # benefit from a different event-loop anyway.
     def main(reactor):
         return dispatch_magic_folder_api_command(sys.argv[1:])
     return react(main)
@@ -900,13 +900,18 @@ class BaseOptions(usage.Options):
     _http_client = None  # lazy-initalized by .client @property
     _client = None  # lazy-instantiated by .client @property
     _ws_agent = None  # lazy-instantiated by .websocket_agent
+    _config_path_cache = None  # (str, FilePath) cached by ._config_path
 
     @property
     def _config_path(self):
         """
         The FilePath where our config is located
         """
-        return FilePath(self['config'])
+        # "config" can still change until options are parsed, so only
+        # re-use a FilePath built from the current value.
+        if self._config_path_cache is None or self._config_path_cache[0] != self['config']:
+            self._config_path_cache = (self['config'], FilePath(self['config']))
+        return self._config_path_cache[1]
 
     @property
     def config(self):
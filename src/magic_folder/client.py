@@ -183,9 +183,12 @@ class MagicFolderClient(object):
             'scan_interval': scan_interval,
         }, ensure_ascii=False).encode('utf-8'))
 
-    def scan_folder_local(self, magic_folder):
+    def scan_folder_local(self, magic_folder, paths=None):
         api_url = self.base_url.child(u'v1', u'magic-folder', magic_folder, u'scan-local')
-        return self._authorized_request("PUT", api_url, body=b"")
+        body = b""
+        if paths is not None:
+            body = json.dumps({"paths": list(paths)}, ensure_ascii=False).encode("utf-8")
+        return self._authorized_request("PUT", api_url, body=body)
 
     def poll_folder_remote(self, magic_folder):
         api_url = self.base_url.child(u'v1', u'magic-folder', magic_folder, u'poll-remote')
@@ -537,6 +537,13 @@ def _upgraded(schema, connection):
     """
     with connection:
         cursor = connection.cursor()
+        # Reading the version needs no lock, and almost every time we
+        # open a database it is already current; only take the write
+        # lock (and re-check the version under it) if an upgrade looks
+        # necessary. This keeps short-lived processes such as the CLI
+        # from contending with a running daemon.
+        if schema.get_version(cursor) == schema.version:
+            return connection
         cursor.execute("BEGIN IMMEDIATE TRANSACTION")
         schema.run_upgrades(cursor)
     return connection
@@ -228,14 +228,17 @@ class MagicFolder(service.MultiService):
             get_participants,
         )
 
-    def scan_local(self):
+    def scan_local(self, relpaths=None):
         """
         Scan the magic folder for changes.
 
+        :param Optional[list[str]] relpaths: only scan these paths (relative
+            to the magic folder), rather than the whole folder.
+
         :returns Deferred[None]: that fires when all the changed files have
             been snapshotted.
         """
-        return self.scanner_service.scan_once()
+        return self.scanner_service.scan_once(relpaths)
 
     def poll_remote(self):
         """
@@ -59,7 +59,7 @@ def parse_pidfile(pidfile):
 
 
 @contextmanager
-def check_pid_process(pidfile, log, find_process=None):
+def check_pid_process(pidfile, log, find_process=None, lock_timeout=2):
     """
     If another instance appears to be running already, raise an
     exception.  Otherwise, write our PID + start time to the pidfile
@@ -71,12 +71,15 @@ def check_pid_process(pidfile, log, find_process=None):
 
     :param Callable find_process: None, or a custom way to get a
         Process objet (usually for tests)
+
+    :param float lock_timeout: how many seconds to wait for another
+        process to release the pidfile lock before giving up.
     """
     find_process = psutil.Process if find_process is None else find_process
     lock_path = _pidfile_to_lockpath(pidfile)
 
     try:
-        with FileLock(lock_path.path, timeout=2):
+        with FileLock(lock_path.path, timeout=lock_timeout):
             # check if we have another instance running already
             if pidfile.exists():
                 pid, starttime = parse_pidfile(pidfile)
@@ -115,7 +118,7 @@ def check_pid_process(pidfile, log, find_process=None):
 
     log.debug("Removing {pidpath}", pidpath=pidfile.path)
     try:
-        with FileLock(lock_path.path, timeout=2):
+        with FileLock(lock_path.path, timeout=lock_timeout):
             try:
                 pidfile.remove()
             except Exception as e:
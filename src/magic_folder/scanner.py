@@ -97,11 +97,18 @@ class ScannerService(MultiService):
         yield super(ScannerService, self).stopService()
         yield self._cooperator.stop()
 
-    def scan_once(self):
+    def scan_once(self, relpaths=None):
         """
         Perform a scan for new files.
+
+        :param Optional[list[str]] relpaths: If given, only these paths
+            (relative to the magic-folder) are examined instead of walking
+            the whole folder. Such a partial scan does not count as a
+            completed scan for status purposes.
         """
-        return self._periodic_service.call_soon()
+        if relpaths is None:
+            return self._periodic_service.call_soon()
+        return self._scan(relpaths)
 
     def _deserialize_local_snapshots(self):
         """
@@ -141,11 +148,14 @@ class ScannerService(MultiService):
 
     @exclusively
     @inline_callbacks
-    def _scan(self):
+    def _scan(self, relpaths=None):
         """
         Perform a scan for new files, and wait for all the snapshots to be
         complete. This means all LocalSnapshots are created and
         serialized into the database (they may not yet be uploaded).
+
+        :param Optional[list[str]] relpaths: If given, only scan these
+            paths rather than the whole magic-folder.
         """
 
         # this is finding and processing files in parallel .. so it
@@ -164,10 +174,12 @@ class ScannerService(MultiService):
 
         with start_action(action_type="scanner:find-updates"):
             yield find_updated_files(
-                self._cooperator, self._config, process, self._status
+                self._cooperator, self._config, process, self._status,
+                relpaths=relpaths,
             )
             yield find_deleted_files(
-                self._cooperator, self._config, process, self._status
+                self._cooperator, self._config, process, self._status,
+                relpaths=relpaths,
             )
 
         def create_update(path):
@@ -183,7 +195,53 @@ class ScannerService(MultiService):
         )
 
 
-def find_updated_files(cooperator, folder_config, on_new_file, status):
+def _normalize_relpaths(magic_path, relpaths):
+    """
+    Bring user-supplied relpaths into the form the rest of the scanner
+    (and the database) uses, so that e.g. ``./a`` and ``a/`` both mean
+    ``a``.
+
+    :param FilePath magic_path: the root of the magic-folder
+
+    :param Iterable[str] relpaths: paths relative to ``magic_path``
+
+    :raises InsecurePath: if a path is outside the magic-folder
+
+    :returns set[str]: the normalized relpaths; the magic-folder itself
+        is the empty string.
+    """
+    normalized = set()
+    for relpath in relpaths:
+        path = magic_path.preauthChild(relpath)
+        if path == magic_path:
+            normalized.add(u"")
+        else:
+            normalized.add(u"/".join(path.segmentsFrom(magic_path)))
+    return normalized
+
+
+def _targeted_paths(magic_path, relpaths):
+    """
+    Produce the paths a scan of only ``relpaths`` should examine. Paths
+    that don't exist are skipped and directories are descended into,
+    just as a full scan would.
+
+    :param FilePath magic_path: the root of the magic-folder
+
+    :param Iterable[str] relpaths: paths relative to ``magic_path``
+
+    :returns Iterator[FilePath]: each existing path, once
+    """
+    seen = set()
+    for relpath in sorted(_normalize_relpaths(magic_path, relpaths)):
+        for path in magic_path.preauthChild(relpath).walk():
+            if path == magic_path or path in seen or not path.exists():
+                continue
+            seen.add(path)
+            yield path
+
+
+def find_updated_files(cooperator, folder_config, on_new_file, status, relpaths=None):
     """
     :param Cooperator cooperator: The cooperator to use to control yielding to
         the reactor.
@@ -196,6 +254,10 @@ def find_updated_files(cooperator, folder_config, on_new_file, status):
 
     :param FileStatus status: The status implementation to report errors to.
 
+    :param Optional[list[str]] relpaths: If given, only these paths are
+        examined instead of walking the whole magic-folder. Paths that do
+        not exist are skipped and directories are scanned recursively.
+
     :returns Deferred[None]: Deferred that fires once the scan is complete.
     """
     action = current_action()
@@ -235,16 +297,24 @@ def find_updated_files(cooperator, folder_config, on_new_file, status):
                 else:
                     action.add_success_fields(update=True)
 
+    if relpaths is None:
+        paths = (
+            path
+            for path in magic_path.walk()
+            if path != magic_path
+        )
+    else:
+        paths = _targeted_paths(magic_path, relpaths)
+
     return cooperator.coiterate(
         (
             process_file(path)
-            for path in magic_path.walk()
-            if path != magic_path
+            for path in paths
         )
     )
 
 
-def find_deleted_files(cooperator, folder_config, on_deleted_file, status):
+def find_deleted_files(cooperator, folder_config, on_deleted_file, status, relpaths=None):
     """
     :param Cooperator cooperator: The cooperator to use to control yielding to
         the reactor.
@@ -257,6 +327,10 @@ def find_deleted_files(cooperator, folder_config, on_deleted_file, status):
 
     :param FileStatus status: The status implementation to report errors to.
 
+    :param Optional[list[str]] relpaths: If given, only these paths (and,
+        for directories, everything below them) are checked instead of
+        every path we have a snapshot for.
+
     :returns Deferred[None]: Deferred that fires once the scan is complete.
     """
 
@@ -279,9 +353,23 @@ def find_deleted_files(cooperator, folder_config, on_deleted_file, status):
                 if remote_content is not None:
                     on_deleted_file(path)
 
+    snapshot_paths = folder_config.get_all_snapshot_paths()
+    if relpaths is not None:
+        wanted = _normalize_relpaths(folder_config.magic_path, relpaths)
+        # the empty relpath is the magic-folder itself, i.e. everything
+        if u"" not in wanted:
+            snapshot_paths = set(
+                relpath
+                for relpath in snapshot_paths
+                if relpath in wanted or any(
+                    relpath.startswith(prefix + u"/")
+                    for prefix in wanted
+                )
+            )
+
     return cooperator.coiterate(
         (
             process_file(relpath)
-            for relpath in folder_config.get_all_snapshot_paths()
+            for relpath in snapshot_paths
         )
     )
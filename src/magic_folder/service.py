@@ -31,7 +31,10 @@ from twisted.logger import (
 from .common import APIError, NoSuchMagicFolder
 from .endpoints import client_endpoint_from_address
 from .magic_folder import MagicFolder
-from .snapshot import create_local_author
+from .snapshot import (
+    create_local_author,
+    format_filenode,
+)
 from .status import (
     IStatus,
     EventsWebSocketStatusService,
@@ -399,31 +402,28 @@ class MagicFolderService(MultiService):
             json.dumps({"version": 1}).encode("utf8")
         )
 
-        # create an unlinked directory and get the collective write-cap
-        collective_write_cap = yield self.tahoe_client.create_mutable_directory()
-        yield self.tahoe_client.add_entry_to_mutable_directory(
-            mutable_cap=collective_write_cap,
-            path_name="@metadata",
-            entry_cap=dir_metadata_cap,
-        )
+        # Each directory is created together with its entries, so this
+        # is one Tahoe request per directory; avoid going back to
+        # adding the entries afterwards with one request each.
 
         # create the personal dmd write-cap
-        personal_write_cap = yield self.tahoe_client.create_mutable_directory()
-        yield self.tahoe_client.add_entry_to_mutable_directory(
-            mutable_cap=personal_write_cap,
-            path_name="@metadata",
-            entry_cap=dir_metadata_cap,
-        )
+        personal_write_cap = yield self.tahoe_client.create_mutable_directory({
+            "@metadata": format_filenode(dir_metadata_cap),
+        })
 
-        # 'attenuate' our personal dmd write-cap to a read-cap
+        # 'attenuate' our personal dmd write-cap to a read-cap (this is
+        # local, it needs no request)
         personal_readonly_cap = personal_write_cap.to_readonly()
 
-        # add ourselves to the collective
-        yield self.tahoe_client.add_entry_to_mutable_directory(
-            mutable_cap=collective_write_cap,
-            path_name=author_name,
-            entry_cap=personal_readonly_cap,
-        )
+        # create an unlinked collective directory, with ourselves
+        # already in it, and get the collective write-cap
+        collective_write_cap = yield self.tahoe_client.create_mutable_directory({
+            "@metadata": format_filenode(dir_metadata_cap),
+            author_name: [
+                "dirnode",
+                {"ro_uri": personal_readonly_cap.danger_real_capability_string()},
+            ],
+        })
 
         self.config.create_magic_folder(
             name,
@@ -5,6 +5,8 @@
 Tests for `magic-folder-api`.
 """
 
+import json
+
 from eliot.twisted import inline_callbacks
 from testtools.matchers import Equals
 from twisted.internet import reactor
@@ -94,6 +96,83 @@ class ScanMagicFolder(AsyncTestCase):
             Equals({relpath}),
         )
 
+    def record_request_bodies(self):
+        """
+        Record the body of every request made through our HTTP client.
+
+        :returns list[bytes]: the bodies, filled in as requests are made.
+        """
+        bodies = []
+        request = self.node.http_client.request
+
+        def recording_request(method, url, **kwargs):
+            bodies.append(kwargs.get("data"))
+            return request(method, url, **kwargs)
+        self.patch(self.node.http_client, "request", recording_request)
+        return bodies
+
+    @inline_callbacks
+    def test_scan_magic_folder_full_scan_empty_body(self):
+        """
+        Scanning a magic folder without any relpaths sends an empty
+        body, which asks for the whole folder to be scanned.
+        """
+        self.magic_path.child("file").setContent(b"content")
+        bodies = self.record_request_bodies()
+
+        outcome = yield self.api_cli(
+            [
+                u"scan",
+                u"--folder",
+                self.folder_name,
+            ],
+        )
+        self.assertThat(
+            outcome.succeeded(),
+            Equals(True),
+        )
+        self.assertThat(
+            bodies,
+            Equals([b""]),
+        )
+
+    @inline_callbacks
+    def test_scan_magic_folder_relpaths(self):
+        """
+        Scanning a magic folder with some relpaths creates snapshots of
+        only those files (and of the files below a named directory).
+        """
+        self.magic_path.child("one").setContent(b"content")
+        self.magic_path.child("two").setContent(b"content")
+        subdir = self.magic_path.child("subdir")
+        subdir.makedirs()
+        subdir.child("three").setContent(b"content")
+        bodies = self.record_request_bodies()
+
+        outcome = yield self.api_cli(
+            [
+                u"scan",
+                u"--folder",
+                self.folder_name,
+                u"one",
+                u"subdir",
+            ],
+        )
+        self.assertThat(
+            outcome.succeeded(),
+            Equals(True),
+        )
+        self.assertThat(
+            [json.loads(body) for body in bodies],
+            Equals([{"paths": ["one", "subdir"]}]),
+        )
+
+        snapshot_paths = self.folder_config.get_all_snapshot_paths()
+        self.assertThat(
+            snapshot_paths,
+            Equals({"one", "subdir/three"}),
+        )
+
     @inline_callbacks
     def test_scan_magic_folder_missing_name(self):
         """
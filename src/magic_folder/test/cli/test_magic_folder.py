@@ -1,5 +1,4 @@
 import json
-import os.path
 
 from eliot.twisted import inline_callbacks
 
@@ -555,9 +554,6 @@ class ConfigOptionTests(SyncTestCase):
         """
         Test if synonsis is defined for the help switch.
         """
-        self.basedir = "cli/MagicFolder/help_synopsis"
-        os.makedirs(self.basedir)
-
         o = magic_folder_cli.AddOptions()
         o.parent = magic_folder_cli.MagicFolderCommand()
         o.parent.getSynopsis()
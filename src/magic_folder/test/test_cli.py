@@ -54,6 +54,7 @@ from testtools.matchers import (
     Equals,
     ContainsDict,
     Contains,
+    Is,
 )
 from treq.testing import (
     RequestSequence,
@@ -156,6 +157,19 @@ class TestBaseOptions(SyncTestCase):
         self.options = BaseOptions()
         self.options['config'] = self.base.path
 
+    def test_config_path(self):
+        """
+        ``_config_path`` is built once per "config" value and follows
+        later changes to it.
+        """
+        first = self.options._config_path
+        self.assertThat(first, Equals(self.base))
+        self.assertThat(self.options._config_path, Is(first))
+
+        other = FilePath(self.mktemp())
+        self.options['config'] = other.path
+        self.assertThat(self.options._config_path, Equals(other))
+
     def test_client_endpoint(self):
         with self.base.child("api_client_endpoint").open("w") as f:
             f.write(b"not running\n")
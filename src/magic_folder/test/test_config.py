@@ -164,6 +164,25 @@ class TestGlobalConfig(SyncTestCase):
             )
         )
 
+    def test_load_db_while_locked(self):
+        """
+        ``load_global_configuration`` does not need the database write lock
+        when the schema is already up to date.
+        """
+        create_global_configuration(self.temp, u"tcp:1234", self.node_dir, u"tcp:localhost:1234")
+        other = sqlite3.connect(self.temp.child("global.sqlite").path)
+        self.addCleanup(other.close)
+        other.execute("BEGIN IMMEDIATE TRANSACTION")
+        self.addCleanup(other.rollback)
+
+        config = load_global_configuration(self.temp)
+        self.assertThat(
+            config,
+            MatchesStructure(
+                api_endpoint=Equals(u"tcp:1234"),
+            )
+        )
+
     def test_load_db_no_such_directory(self):
         """
         ``load_global_configuration`` raises ``ValueError`` if passed a path which
@@ -125,6 +125,18 @@ from .fixtures import (
 )
 
 
+@inline_callbacks
+def _wait_until(predicate, timeout=10, interval=0.1):
+    """
+    Wait on the real reactor until ``predicate()`` is true, checking every
+    ``interval`` seconds for up to ``timeout`` seconds. Callers assert on
+    the outcome afterwards.
+    """
+    deadline = reactor.seconds() + timeout
+    while not predicate() and reactor.seconds() < deadline:
+        yield deferLater(reactor, interval, lambda: None)
+
+
 class CacheTests(SyncTestCase):
     """
     Tests for ``RemoteSnapshotCacheService``
@@ -490,11 +502,10 @@ class UpdateTests(AsyncTestCase):
         )
 
         # wait for the downloader to put this into Alice's magic-folder
-        for _ in range(10):
-            if "foo" in self.magic_path.listdir():
-                if self.magic_path.child("foo").getContent() == content:
-                    break
-            yield deferLater(reactor, 1.0, lambda: None)
+        yield _wait_until(
+            lambda: "foo" in self.magic_path.listdir()
+            and self.magic_path.child("foo").getContent() == content
+        )
         self.assertThat(
             self.magic_path.child("foo"),
             MatchesAll(
@@ -533,10 +544,9 @@ class UpdateTests(AsyncTestCase):
         )
 
         # wait for the downloader to put this into Alice's magic-folder
-        for _ in range(10):
-            if "foo.conflict-zara" in self.magic_path.listdir():
-                break
-            yield deferLater(reactor, 1.0, lambda: None)
+        yield _wait_until(
+            lambda: "foo.conflict-zara" in self.magic_path.listdir()
+        )
 
         # we should conflict
         self.assertThat(
@@ -598,11 +608,10 @@ class UpdateTests(AsyncTestCase):
 
         # wait for the downloader to put this into Alice's
         # magic-folder, which should (eventually) match the update.
-        for _ in range(10):
-            if "foo" in self.magic_path.listdir():
-                if self.magic_path.child("foo").getContent() == content1:
-                    break
-            yield deferLater(reactor, 1.0, lambda: None)
+        yield _wait_until(
+            lambda: "foo" in self.magic_path.listdir()
+            and self.magic_path.child("foo").getContent() == content1
+        )
         self.assertThat(
             self.magic_path.child("foo"),
             MatchesAll(
@@ -665,11 +674,10 @@ class UpdateTests(AsyncTestCase):
 
         # wait for the downloader to put this into Alice's
         # magic-folder, which should (eventually) match the update.
-        for _ in range(10):
-            if "foo" in self.magic_path.listdir():
-                if self.magic_path.child("foo").getContent() == content1:
-                    break
-            yield deferLater(reactor, 1.0, lambda: None)
+        yield _wait_until(
+            lambda: "foo" in self.magic_path.listdir()
+            and self.magic_path.child("foo").getContent() == content1
+        )
         self.assertThat(
             self.magic_path.child("foo"),
             MatchesAll(
@@ -696,11 +704,10 @@ class UpdateTests(AsyncTestCase):
 
         # wait for the downloader to put this into Alice's
         # magic-folder, which should (eventually) match the update.
-        for _ in range(10):
-            if "foo" in self.magic_path.listdir():
-                if self.magic_path.child("foo").getContent() == content2:
-                    break
-            yield deferLater(reactor, 1.0, lambda: None)
+        yield _wait_until(
+            lambda: "foo" in self.magic_path.listdir()
+            and self.magic_path.child("foo").getContent() == content2
+        )
         self.assertThat(
             self.magic_path.child("foo"),
             MatchesAll(
@@ -755,10 +762,9 @@ class UpdateTests(AsyncTestCase):
 
         # wait for the downloader to put this into Alice's
         # magic-folder, which should cause a conflcit
-        for _ in range(10):
-            if "foo.conflict-zara" in self.magic_path.listdir():
-                break
-            yield deferLater(reactor, 1.0, lambda: None)
+        yield _wait_until(
+            lambda: "foo.conflict-zara" in self.magic_path.listdir()
+        )
         self.assertThat(
             self.magic_path.child("foo"),
             MatchesAll(
@@ -787,11 +793,10 @@ class UpdateTests(AsyncTestCase):
             replace=True,
         )
 
-        for _ in range(10):
-            if "foo.conflict-zara" in self.magic_path.listdir():
-                if self.magic_path.child("foo.conflict-zara").getContent() != content1:
-                    print("weird content")
-            yield deferLater(reactor, 1.0, lambda: None)
+        # wait for a poll that started after the update was linked,
+        # and for the file to settle again
+        yield self.service.poll_remote()
+        yield self.service.file_factory.finish()
         self.assertThat(
             self.magic_path.child("foo"),
             MatchesAll(
@@ -844,10 +849,9 @@ class UpdateTests(AsyncTestCase):
             )
 
             # wait for the downloader to detect zara's change
-            for _ in range(10):
-                yield deferLater(reactor, 1.0, lambda: None)
-                if self.magic_path.listdir() == ['foo.conflict-zara', 'foo']:
-                    break
+            yield _wait_until(
+                lambda: self.magic_path.listdir() == ['foo.conflict-zara', 'foo']
+            )
 
         # we should discover and mark this last-second conflict by
         # keeping "our" content in "foo" and putting zara's content in
@@ -888,10 +892,9 @@ class UpdateTests(AsyncTestCase):
         # wait for the uploader to do its work (that is, for more data
         # to appear in "tahoe")
         yield self.service.scanner_service.scan_once()
-        for _ in range(10):
-            yield deferLater(reactor, 1.0, lambda: None)
-            if len(self.root._uri.data.keys()) != len(start):
-                break
+        yield _wait_until(
+            lambda: len(self.root._uri.data.keys()) != len(start)
+        )
 
         # create a (legitimate) update from zara to the same file (so
         # that our downloader has some work to do)
@@ -935,10 +938,9 @@ class UpdateTests(AsyncTestCase):
         # the running of the mark_overwrite function, essentially
         # .. this should then rename the preserved tempfile as a
         # conflict-file
-        for _ in range(10):
-            yield deferLater(reactor, 1.0, lambda: None)
-            if self.magic_path.listdir() == ['foo.conflict-zara', 'foo']:
-                break
+        yield _wait_until(
+            lambda: self.magic_path.listdir() == ['foo.conflict-zara', 'foo']
+        )
 
         self.assertThat(
             self.magic_path.child("foo"),
@@ -1010,10 +1012,9 @@ class UpdateTests(AsyncTestCase):
         # the running of the mark_overwrite function, essentially
         # .. this should then rename the preserved tempfile as a
         # conflict-file
-        for _ in range(10):
-            yield deferLater(reactor, 1.0, lambda: None)
-            if self.magic_path.listdir() == ['foo.conflict-zara', 'foo']:
-                break
+        yield _wait_until(
+            lambda: self.magic_path.listdir() == ['foo.conflict-zara', 'foo']
+        )
 
         self.assertThat(
             self.magic_path.child("foo"),
@@ -1094,10 +1095,10 @@ class UpdateTests(AsyncTestCase):
             "{}.conflict-zara".format(relpath),
             relpath,
         }
-        for _ in range(15):
-            yield deferLater(reactor, 1.0, lambda: None)
-            if set(self.magic_path.listdir()) == expected_files:
-                break
+        yield _wait_until(
+            lambda: set(self.magic_path.listdir()) == expected_files,
+            timeout=15,
+        )
 
         self.assertThat(
             set(self.magic_path.listdir()),
@@ -177,6 +177,6 @@ class PidFileLocking(SyncTestCase):
 
         # acquiring the same lock should fail; it is locked by the subprocess
         with self.assertRaises(ProcessInTheWay):
-            with check_pid_process(pidfile, Logger()):
+            with check_pid_process(pidfile, Logger(), lock_timeout=0.1):
                 pass
         proc.terminate()
@@ -313,6 +313,144 @@ class FindUpdatesTests(SyncTestCase):
             Equals([self.config.magic_path.preauthChild(relpath)])
         )
 
+    @given(
+        relative_paths(),
+    )
+    def test_scan_only_relpaths(self, relpath):
+        """
+        When relpaths are given, only those files are considered; other new
+        files and paths that don't exist are skipped.
+        """
+        wanted = self.magic_path.preauthChild(relpath)
+        wanted.parent().makedirs(ignoreExistingDirectory=True)
+        wanted.setContent(b"dummy\n")
+        self.magic_path.child("other-file").setContent(b"dummy\n")
+
+        files = []
+        self.assertThat(
+            find_updated_files(
+                self.cooperator, self.config, files.append, status=self.folder_status,
+                relpaths=[relpath, "missing-file"],
+            ),
+            succeeded(Always()),
+        )
+        self.assertThat(
+            files,
+            Equals([wanted]),
+        )
+
+    @given(
+        relative_paths(),
+    )
+    def test_scan_delete_only_relpaths(self, relpath):
+        """
+        When relpaths are given, only those are checked for deletion.
+        """
+        self.config.store_currentsnapshot_state(relpath, OLD_PATH_STATE)
+        self.config.store_currentsnapshot_state("other-file", OLD_PATH_STATE)
+
+        files = []
+        self.assertThat(
+            find_deleted_files(
+                self.cooperator, self.config, files.append, status=self.folder_status,
+                relpaths=[relpath],
+            ),
+            succeeded(Always()),
+        )
+        self.assertThat(
+            files,
+            Equals([self.config.magic_path.preauthChild(relpath)])
+        )
+
+    @given(
+        relative_paths(),
+    )
+    def test_scan_relpath_not_normalized(self, relpath):
+        """
+        A relpath spelled differently from how the scanner stores it
+        (leading ``./``, doubled or trailing separators) still selects the
+        file, for both updates and deletes.
+        """
+        spelled = u"./" + relpath.replace(u"/", u"//") + u"/"
+        wanted = self.magic_path.preauthChild(relpath)
+        wanted.parent().makedirs(ignoreExistingDirectory=True)
+        wanted.setContent(b"dummy\n")
+
+        files = []
+        self.assertThat(
+            find_updated_files(
+                self.cooperator, self.config, files.append, status=self.folder_status,
+                relpaths=[spelled],
+            ),
+            succeeded(Always()),
+        )
+        self.assertThat(files, Equals([wanted]))
+
+        wanted.remove()
+        self.config.store_currentsnapshot_state(relpath, OLD_PATH_STATE)
+        deleted = []
+        self.assertThat(
+            find_deleted_files(
+                self.cooperator, self.config, deleted.append, status=self.folder_status,
+                relpaths=[spelled],
+            ),
+            succeeded(Always()),
+        )
+        self.assertThat(deleted, Equals([wanted]))
+
+    @given(
+        relative_paths(),
+    )
+    def test_scan_relpath_directory(self, relpath):
+        """
+        A relpath naming a directory scans everything beneath it, and
+        nothing outside it.
+        """
+        subdir = self.magic_path.child(u"sub")
+        wanted = subdir.preauthChild(relpath)
+        wanted.parent().makedirs(ignoreExistingDirectory=True)
+        wanted.setContent(b"dummy\n")
+        subdir.child(u"top-file").setContent(b"dummy\n")
+        self.magic_path.child(u"other-file").setContent(b"dummy\n")
+
+        files = []
+        self.assertThat(
+            find_updated_files(
+                self.cooperator, self.config, files.append, status=self.folder_status,
+                relpaths=[u"sub"],
+            ),
+            succeeded(Always()),
+        )
+        self.assertThat(
+            sorted(files),
+            Equals(sorted([wanted, subdir.child(u"top-file")])),
+        )
+
+    @given(
+        relative_paths(),
+    )
+    def test_scan_delete_relpath_directory(self, relpath):
+        """
+        A relpath naming a (now deleted) directory checks every snapshot
+        beneath it for deletion, and nothing outside it.
+        """
+        self.config.store_currentsnapshot_state(u"sub/" + relpath, OLD_PATH_STATE)
+        self.config.store_currentsnapshot_state(u"sub-other", OLD_PATH_STATE)
+        self.config.store_currentsnapshot_state(u"other-file", OLD_PATH_STATE)
+
+        files = []
+        self.assertThat(
+            find_deleted_files(
+                self.cooperator, self.config, files.append, status=self.folder_status,
+                relpaths=[u"sub/"],
+            ),
+            succeeded(Always()),
+        )
+        self.assertThat(
+            files,
+            Equals([self.magic_path.preauthChild(u"sub/" + relpath)]),
+        )
+
     @given(
         relative_paths(),
     )
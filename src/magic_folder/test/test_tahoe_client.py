@@ -357,6 +357,24 @@ class TahoeClientTests(SyncTestCase):
             ),
         )
 
+    @given(
+        directory_children()
+    )
+    def test_create_mutable_directory_with_children(self, children):
+        """
+        A mutable directory can be created already containing some
+        children by passing them to ``create_mutable_directory``.
+        """
+        self.assertThat(
+            self.tahoe_client.create_mutable_directory(children),
+            succeeded(
+                AfterPreprocessing(
+                    lambda cap: loads(self.root._uri.data[cap.danger_real_capability_string()])[1]["children"],
+                    Equals(children),
+                ),
+            ),
+        )
+
     @given(directory_children())
     def test_mutable_directories_distinct(self, children):
         """
@@ -108,10 +108,9 @@ class UploadTests(SyncTestCase):
 
     @given(
         relpath=relative_paths(),
-        content=binary(),
         upload_dircap=tahoe_lafs_dir_capabilities(),
     )
-    def test_commit_a_file(self, relpath, content, upload_dircap):
+    def test_commit_a_file(self, relpath, upload_dircap):
         """
         Add a file into localsnapshot store, start the service which
         should result in a remotesnapshot corresponding to the
@@ -177,7 +176,7 @@ class UploadTests(SyncTestCase):
     @given(
         path_segments(),
         lists(
-            binary(),
+            binary(max_size=1024),
             min_size=1,
             max_size=2,
         ),
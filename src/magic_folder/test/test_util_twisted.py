@@ -6,11 +6,12 @@ from hypothesis.errors import StopTest
 from hypothesis.stateful import (RuleBasedStateMachine, initialize, invariant,
                                  precondition, rule, run_state_machine_as_test)
 from hypothesis.strategies import booleans, data
-from testtools.matchers import HasLength, MatchesPredicate
+from testtools.matchers import Equals, HasLength, MatchesPredicate
+from testtools.twistedsupport import failed, has_no_result, succeeded
 from twisted.internet.defer import Deferred
 from twisted.internet.task import Clock
 
-from ..util.twisted import PeriodicService
+from ..util.twisted import PeriodicService, async_to_deferred
 from .common import SyncTestCase
 
 
@@ -196,3 +197,41 @@ class PeriodicSerivceTests(SyncTestCase):
             lambda: PeriodicServiceRuleMachine(self),
             settings=state_settings,
         )
+
+
+class AsyncToDeferredTests(SyncTestCase):
+    """
+    Tests for ``async_to_deferred``.
+    """
+
+    def test_result(self):
+        """
+        The decorated function returns a Deferred that fires with the
+        coroutine's result once everything it awaits has fired.
+        """
+        waiting = Deferred()
+
+        @async_to_deferred
+        async def f(a, b=None):
+            return (a, b, await waiting)
+
+        d = f(1, b=2)
+        self.assertThat(d, has_no_result())
+        waiting.callback(3)
+        self.assertThat(d, succeeded(Equals((1, 2, 3))))
+
+    def test_failure(self):
+        """
+        An exception raised by the coroutine fails the returned Deferred.
+        """
+        @async_to_deferred
+        async def f():
+            raise FailedCall()
+
+        self.assertThat(
+            f(),
+            failed(MatchesPredicate(
+                lambda f: f.check(FailedCall),
+                "%s is not a FailedCall",
+            )),
+        )
@@ -1049,6 +1049,83 @@ class ScanFolderTests(SyncTestCase):
             Equals({path_in_folder}),
         )
 
+    def test_scan_folder_paths(self):
+        """
+        A **PUT** to **/v1/magic-folder/:folder-name/scan-local** with a list
+        of paths only creates local snapshots for those paths.
+        """
+        local_path = FilePath(self.mktemp())
+        local_path.makedirs()
+        local_path.child("wanted").setContent(b"wanted\n")
+        local_path.child("ignored").setContent(b"ignored\n")
+
+        node = MagicFolderNode.create(
+            self.clock,
+            FilePath(self.mktemp()),
+            AUTH_TOKEN,
+            {"default": magic_folder_config("alice", local_path)},
+            start_folder_services=True,
+        )
+        node.global_service.get_folder_service("default").file_factory._synchronous = True
+
+        self.assertThat(
+            authorized_request(
+                node.http_client,
+                AUTH_TOKEN,
+                u"PUT",
+                self.url.child("default", "scan-local"),
+                dumps({"paths": ["wanted"]}).encode("utf8"),
+            ),
+            succeeded(
+                matches_response(
+                    code_matcher=Equals(OK),
+                ),
+            ),
+        )
+
+        folder_config = node.global_config.get_magic_folder("default")
+        self.assertThat(
+            folder_config.get_all_snapshot_paths(),
+            Equals({"wanted"}),
+        )
+
+    def test_scan_folder_path_outside(self):
+        """
+        A **PUT** to **/v1/magic-folder/:folder-name/scan-local** with a path
+        outside the magic-folder is an error.
+        """
+        local_path = FilePath(self.mktemp())
+        local_path.makedirs()
+
+        node = MagicFolderNode.create(
+            self.clock,
+            FilePath(self.mktemp()),
+            AUTH_TOKEN,
+            {"default": magic_folder_config("alice", local_path)},
+            start_folder_services=False,
+        )
+
+        self.assertThat(
+            authorized_request(
+                node.http_client,
+                AUTH_TOKEN,
+                u"PUT",
+                self.url.child("default", "scan-local"),
+                dumps({"paths": ["../escape"]}).encode("utf8"),
+            ),
+            succeeded(
+                matches_response(
+                    code_matcher=Equals(BAD_REQUEST),
+                    body_matcher=AfterPreprocessing(
+                        loads,
+                        ContainsDict({
+                            "reason": Contains("outside the magic-folder"),
+                        })
+                    ),
+                ),
+            ),
+        )
+
     def test_snapshot_no_folder(self):
         """
         An error results from using /v1/magic-folder/<folder-name>/scan-local API on
@@ -24,8 +24,6 @@ import hashlib
 
 import attr
 
-from hyperlink import DecodedURL
-
 from twisted.web.resource import (
     Resource,
 )
@@ -126,19 +124,19 @@ class _FakeTahoeWelcome(Resource, object):
         }).encode("utf8")
 
 
-KNOWN_CAPABILITIES = [
+KNOWN_CAPABILITIES = frozenset(
     getattr(allmydata.uri, t).BASE_STRING.decode("ascii")
     for t in dir(allmydata.uri)
     if hasattr(getattr(allmydata.uri, t), 'BASE_STRING')
-]
-MUTABLE_CAPABILITIES = [
+)
+MUTABLE_CAPABILITIES = frozenset([
     u'URI:DIR2:',
     u'URI:DIR2-RO:',
     u'URI:SSK:',
     u'URI:SSK-RO:',
     u'URI:MDMF:',
     u'URI:MDMF-RO:',
-]
+])
 
 def capability_generator(kind):
     """
@@ -155,7 +153,7 @@ def capability_generator(kind):
         raise ValueError(
             "Unknown capability kind '{} (valid are {})'".format(
                 kind,
-                ", ".join(KNOWN_CAPABILITIES),
+                ", ".join(sorted(KNOWN_CAPABILITIES)),
             )
         )
     # what we do here is to start with empty hashers for the key and
@@ -170,8 +168,8 @@ def capability_generator(kind):
     # capabilities are "prefix:<128-bits-base32>:<256-bits-base32>:N:K:size"
     while True:
         number += 1
-        key_hasher.update("\x00".encode("utf8"))
-        ueb_hasher.update("\x00".encode("utf8"))
+        key_hasher.update(b"\x00")
+        ueb_hasher.update(b"\x00")
 
         key = base32.b2a(key_hasher.digest()[:16]).decode("ascii")  # key is 16 bytes
         ueb_hash = base32.b2a(ueb_hasher.digest()).decode("ascii")  # ueb hash is 32 bytes
@@ -219,6 +217,9 @@ class _FakeTahoeUriHandler(Resource, object):
     data = attr.ib(default=attr.Factory(dict))
     capability_generators = attr.ib(default=attr.Factory(dict))
 
+    # maps immutable content to the capability-string it was stored under
+    _immutable_caps = attr.ib(default=attr.Factory(dict))
+
     # allow tests to cause failures
     _put_errors = attr.ib(default=attr.Factory(list))
 
@@ -272,12 +273,15 @@ class _FakeTahoeUriHandler(Resource, object):
             raise TypeError("'data' must be bytes")
 
         # for immutables we need to check content
-        if kind not in MUTABLE_CAPABILITIES:
-            for k in self.data:
-                if self.data[k] == data:
-                    return (False, k)
+        if kind in MUTABLE_CAPABILITIES:
+            return (True, self._add_new_data(kind, data))
 
-        return (True, self._add_new_data(kind, data))
+        try:
+            return (False, self._immutable_caps[data])
+        except KeyError:
+            cap = self._add_new_data(kind, data)
+            self._immutable_caps[data] = cap
+            return (True, cap)
 
     def add_mutable_data(self, kind, data):
         """
@@ -290,12 +294,8 @@ class _FakeTahoeUriHandler(Resource, object):
         return (False, self._add_new_data(kind, data))
 
     def render_PUT(self, request):
-        uri = DecodedURL.from_text(request.uri.decode("utf8"))
-        fmt = "chk"
-        for arg, value in uri.query:
-            if arg == "format":
-                fmt = value.lower()
-        if fmt != "chk":
+        fmt = request.args.get(b"format", [b"chk"])[-1].lower()
+        if fmt != b"chk":
             raise NotImplementedError()
 
         if len(request.postpath):
@@ -403,24 +403,25 @@ class _FakeTahoeUriHandler(Resource, object):
             self._mkdir_data_to_internal(raw_data),
         )
 
+    # maps the ?t= argument of a POST to the method handling it
+    _post_handlers = {
+        b"mkdir-immutable": _add_immutable_directory,
+        b"mkdir": _add_mutable_directory,
+        b"mkdir-with-children": _add_mutable_directory,
+    }
+
     def render_POST(self, request):
         t = request.args[b"t"][0]
         data = request.content.read()
 
-        type_to_handler = {
-            b"mkdir-immutable": self._add_immutable_directory,
-            b"mkdir": self._add_mutable_directory,
-        }
-        handler = type_to_handler[t]
-        fresh, cap = handler(data)
+        handler = self._post_handlers[t]
+        fresh, cap = handler(self, data)
         return cap.encode("utf8")
 
     def render_GET(self, request):
-        uri = DecodedURL.from_text(request.uri.decode('utf8'))
-        capability = None
-        for arg, value in uri.query:
-            if arg == u"uri":
-                capability = value
+        capability = request.args.get(b"uri", [None])[-1]
+        if capability is not None:
+            capability = capability.decode("utf8")
         # it's legal to use the form "/uri/<capability>"
         if capability is None and request.postpath and request.postpath[0]:
             capability = request.postpath[0].decode("utf8")
@@ -441,7 +442,9 @@ class _FakeTahoeUriHandler(Resource, object):
 
         # the user gave us a capability; if our Grid doesn't have any
         # data for it, that's an error.
-        if capability not in self.data:
+        try:
+            return self.data[capability]
+        except KeyError:
             # Tahoe-LAFS actually has several different behaviors for the
             # ostensible "not found" case.
             #
@@ -461,8 +464,6 @@ class _FakeTahoeUriHandler(Resource, object):
             request.setResponseCode(http.GONE)
             return u"No data for '{}'".format(capability).encode("ascii")
 
-        return self.data[capability]
-
     def _get_child_of_directory(self, request, capability, child_name):
         """
         Return the data which is a in a child of a directory.
@@ -20,6 +20,7 @@ from twisted.internet.defer import (
     Deferred,
     maybeDeferred,
     CancelledError,
+    ensureDeferred,
 )
 from twisted.internet.interfaces import (
     IDelayedCall,
@@ -49,6 +50,19 @@ def exclusively(maybe_f=None, lock_name="_lock"):
         return wrap(maybe_f)
 
 
+def async_to_deferred(f):
+    """
+    A function decorator that turns a coroutine function into one that
+    returns a Deferred, for callers that expect Twisted APIs.
+    """
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        return ensureDeferred(f(*args, **kwargs))
+
+    return wrapper
+
+
 def cancelled(*args, **kw):
     """
     A function that takes any arguments at all and returns a Deferred
@@ -25,6 +25,7 @@ from eliot.twisted import inline_callbacks
 
 from twisted.python.filepath import (
     FilePath,
+    InsecurePath,
 )
 from twisted.internet.defer import (
     returnValue,
@@ -400,10 +401,30 @@ def _create_v1_resource(global_config, global_service, status_service):
     def scan_folder_local(request, folder_name):
         """
         Request an immediate local scan on a particular folder
+
+        The body may be empty, or a JSON dict with a "paths" key: a list
+        of paths relative to the folder. When given, only those paths are
+        scanned rather than the whole folder.
         """
         folder_service = global_service.get_folder_service(folder_name)
 
-        yield folder_service.scan_local()
+        relpaths = None
+        body = request.content.read()
+        if body:
+            data = _load_json(body)
+            if not isinstance(data, dict) or set(data.keys()) - {"paths"}:
+                raise _InputError('Body must be empty or {"paths": [...]}')
+            relpaths = data.get("paths")
+            if relpaths is not None:
+                if not isinstance(relpaths, list) or not all(isinstance(p, str) for p in relpaths):
+                    raise _InputError('"paths" must be a list of strings')
+                for relpath in relpaths:
+                    try:
+                        folder_service.config.magic_path.preauthChild(relpath)
+                    except InsecurePath:
+                        raise _InputError("Path '{}' is outside the magic-folder".format(relpath))
+
+        yield folder_service.scan_local(relpaths)
 
         _application_json(request)
         returnValue(b"{}")